@@ -14,6 +14,8 @@ a = Analysis(
         'oauthlib.openid.connect.core.grant_types.hybrid',
         'oauthlib.openid.connect.core.grant_types.refresh_token',
         'pkg_resources.py2_warn',
+        'watchdog.observers.read_directory_changes',
+        'watchdog.observers.fsevents',
     ],
     hookspath=[],
     hooksconfig={},
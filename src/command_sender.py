@@ -1,49 +1,17 @@
 """Command sending functionality for Steam Upload Helper"""
 
-import platform
+import atexit
+import os
 import subprocess
+import tempfile
 import time
 from pathlib import Path
 from typing import Optional, Callable
-from platform_helpers import ConsoleMonitor
+from platform_helpers import ConsoleMonitor, _SYSTEM, _remove_file
 
 
-class CommandSender:
-    """プラットフォーム共通のコマンド送信クラス"""
-    
-    @staticmethod
-    def send_command(command: str, target_window_pattern: str = "Steam>", 
-                    process_id: Optional[int] = None, 
-                    log_callback: Optional[Callable] = None) -> bool:
-        """
-        コンソールウィンドウにコマンドを送信
-        
-        Args:
-            command: 送信するコマンド
-            target_window_pattern: ターゲットウィンドウを識別するパターン
-            process_id: Windows用のプロセスID（オプション）
-            log_callback: ログ出力用のコールバック
-            
-        Returns:
-            bool: 送信成功/失敗
-        """
-        system = platform.system()
-        
-        if system == "Windows":
-            return CommandSender._send_windows(command, target_window_pattern, process_id, log_callback)
-        elif system == "Darwin":
-            return CommandSender._send_macos(command, target_window_pattern, log_callback)
-        else:
-            return CommandSender._send_linux(command, target_window_pattern, log_callback)
-    
-    @staticmethod
-    def _send_windows(command: str, target_pattern: str, process_id: Optional[int], log_callback) -> bool:
-        """Windows環境でのコマンド送信"""
-        try:
-            escaped_command = command.replace('"', '`"').replace("'", "''")
-            
-            # PowerShellスクリプト
-            ps_script = f'''
+# コンソールへのコマンド送信用PowerShellスクリプト（$Commandと$TargetPatternを引数で受け取る）
+_SEND_WINDOWS_PS_SCRIPT = r'''param([string]$Command, [string]$TargetPattern)
 Add-Type -AssemblyName System.Windows.Forms
 
 Add-Type @"
@@ -51,7 +19,7 @@ Add-Type @"
     using System.Runtime.InteropServices;
     using System.Text;
 
-    public class InputHelper {{
+    public class InputHelper {
         [DllImport("user32.dll")]
         public static extern bool EnumWindows(EnumWindowsProc enumProc, IntPtr lParam);
 
@@ -83,41 +51,41 @@ Add-Type @"
         public static extern bool ImmSetOpenStatus(IntPtr hIMC, bool fOpen);
 
         public delegate bool EnumWindowsProc(IntPtr hWnd, IntPtr lParam);
-    }}
+    }
 "@
 
 # Find console window
 $candidates = @()
-$callback = {{
+$callback = {
     param($hWnd, $lParam)
     $sb = New-Object System.Text.StringBuilder 256
     [InputHelper]::GetWindowText($hWnd, $sb, $sb.Capacity) | Out-Null
     $title = $sb.ToString()
 
-    if ([InputHelper]::IsWindowVisible($hWnd)) {{
+    if ([InputHelper]::IsWindowVisible($hWnd)) {
         # Look for windows containing the target pattern
-        if ($title -like "*{target_pattern}*" -or $title -like "*steamcmd*" -or $title -like "*MornSteamCMD*") {{
+        if ($title -like "*$TargetPattern*" -or $title -like "*steamcmd*" -or $title -like "*MornSteamCMD*") {
             $procId = 0
             [InputHelper]::GetWindowThreadProcessId($hWnd, [ref]$procId) | Out-Null
             
-            $obj = [PSCustomObject]@{{
+            $obj = [PSCustomObject]@{
                 Handle = $hWnd
                 Title = $title
                 PID = $procId
-            }}
+            }
             $script:candidates += $obj
-        }}
-    }}
+        }
+    }
     return $true
-}}
+}
 
 $candidates = @()
 [InputHelper]::EnumWindows($callback, [IntPtr]::Zero) | Out-Null
 
-if ($candidates.Count -eq 0) {{
+if ($candidates.Count -eq 0) {
     Write-Output "NOTFOUND"
     exit 1
-}}
+}
 
 # Select best candidate
 $targetWindow = $candidates[0]
@@ -129,37 +97,88 @@ $originalWindow = [InputHelper]::GetForegroundWindow()
 [InputHelper]::SetForegroundWindow($targetWindow.Handle) | Out-Null
 Start-Sleep -Milliseconds 100
 
-try {{
+try {
     # Copy command to clipboard
-    Set-Clipboard -Value "{escaped_command}"
+    Set-Clipboard -Value $Command
 
     # Disable IME if needed
     $hIMC = [InputHelper]::ImmGetContext($targetWindow.Handle)
-    if ($hIMC -ne [IntPtr]::Zero) {{
+    if ($hIMC -ne [IntPtr]::Zero) {
         $imeStatus = [InputHelper]::ImmGetOpenStatus($hIMC)
-        if ($imeStatus) {{
+        if ($imeStatus) {
             [InputHelper]::ImmSetOpenStatus($hIMC, $false) | Out-Null
-        }}
+        }
         [InputHelper]::ImmReleaseContext($targetWindow.Handle, $hIMC) | Out-Null
-    }}
+    }
     Start-Sleep -Milliseconds 50
 
     # Paste from clipboard + enter
-    [System.Windows.Forms.SendKeys]::SendWait("^v{{ENTER}}")
+    [System.Windows.Forms.SendKeys]::SendWait("^v{ENTER}")
     Write-Output "SUCCESS"
-}} catch {{
+} catch {
     Write-Output "ERROR: $_"
     exit 1
-}} finally {{
+} finally {
     # Restore focus
-    if ($originalWindow -ne [IntPtr]::Zero) {{
+    if ($originalWindow -ne [IntPtr]::Zero) {
         [InputHelper]::SetForegroundWindow($originalWindow) | Out-Null
-    }}
-}}
+    }
+}
 '''
+
+
+class CommandSender:
+    """プラットフォーム共通のコマンド送信クラス"""
+    
+    _windows_script_path = None  # 書き出し済みの送信用スクリプトのパス
+    
+    @staticmethod
+    def send_command(command: str, target_window_pattern: str = "Steam>", 
+                    process_id: Optional[int] = None, 
+                    log_callback: Optional[Callable] = None) -> bool:
+        """
+        コンソールウィンドウにコマンドを送信
+        
+        Args:
+            command: 送信するコマンド
+            target_window_pattern: ターゲットウィンドウを識別するパターン
+            process_id: Windows用のプロセスID（オプション）
+            log_callback: ログ出力用のコールバック
+            
+        Returns:
+            bool: 送信成功/失敗
+        """
+        system = _SYSTEM
+        
+        if system == "Windows":
+            return CommandSender._send_windows(command, target_window_pattern, process_id, log_callback)
+        elif system == "Darwin":
+            return CommandSender._send_macos(command, target_window_pattern, log_callback)
+        else:
+            return CommandSender._send_linux(command, target_window_pattern, log_callback)
+    
+    @staticmethod
+    def _get_windows_script_path() -> str:
+        """送信用PowerShellスクリプトをプロセスごとの一時ファイルに一度だけ書き出す"""
+        if CommandSender._windows_script_path is None:
+            fd, script_path = tempfile.mkstemp(prefix="morn_send_", suffix=".ps1")
+            # Windows PowerShell 5.xでも正しく読めるようBOM付きUTF-8で保存
+            with os.fdopen(fd, 'w', encoding='utf-8-sig') as f:
+                f.write(_SEND_WINDOWS_PS_SCRIPT)
+            atexit.register(_remove_file, script_path)
+            CommandSender._windows_script_path = script_path
+        return CommandSender._windows_script_path
+    
+    @staticmethod
+    def _send_windows(command: str, target_pattern: str, process_id: Optional[int], log_callback) -> bool:
+        """Windows環境でのコマンド送信"""
+        try:
+            # 事前に書き出したPowerShellスクリプトにコマンドとウィンドウパターンを引数で渡す
+            script_path = CommandSender._get_windows_script_path()
             
             result = subprocess.run(
-                ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', ps_script],
+                ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-File', script_path,
+                 command, target_pattern],
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -271,7 +290,8 @@ return "SUCCESS: " & debugInfo
             result = subprocess.run(
                 ['osascript', '-e', apple_script],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=10
             )
             
             # デバッグ情報を出力
@@ -319,7 +339,7 @@ return "SUCCESS: " & debugInfo
             log_callback("SteamCMDテストを開始します...")
         
         # プラットフォーム別にSteamCMDを起動
-        system = platform.system()
+        system = _SYSTEM
         
         try:
             if system == "Windows":
@@ -1,7 +1,7 @@
 """Configuration management for Steam Upload Helper"""
 
 import flet as ft
-import time
+import logging
 from ui_helpers import DialogBuilder, ConfigDialogBuilder, SteamPageOpener
 
 
@@ -11,6 +11,7 @@ class ConfigManager:
     def __init__(self, helper, page: ft.Page):
         self.helper = helper
         self.page = page
+        self._log = logging.getLogger("msuh.config")
         
         # UIコンポーネント
         self.config_dropdown = None
@@ -105,7 +106,7 @@ class ConfigManager:
         self._update_button_states()
         
         self.page.update()
-        self._log_message(f"設定を読み込みました: {self.config_dropdown.value}")
+        self._log.info(f"設定を読み込みました: {self.config_dropdown.value}")
         
         if self.on_config_loaded:
             self.on_config_loaded(config)
@@ -134,7 +135,7 @@ class ConfigManager:
         self._update_button_states()
         
         self.page.update()
-        self._log_message(f"設定を削除しました: {name}")
+        self._log.info(f"設定を削除しました: {name}")
         
         if self.on_config_changed:
             self.on_config_changed()
@@ -165,6 +166,13 @@ class ConfigManager:
             if hasattr(e, 'page') and e.page:
                 e.page.update()
         
+        # App IDはSteamページボタンの更新と必須チェックの両方を行う
+        update_steam_buttons = fields['app_id'].on_change
+        
+        def on_app_id_change(e):
+            update_steam_buttons(e)
+            validate_fields(e)
+        
         # フォルダ選択ボタン（検証関数付き）
         def on_folder_selected():
             validate_fields()
@@ -178,7 +186,7 @@ class ConfigManager:
         
         # 各フィールドの変更を監視
         fields['name'].on_change = validate_fields
-        fields['app_id'].on_change = validate_fields
+        fields['app_id'].on_change = on_app_id_change
         fields['depot_id'].on_change = validate_fields
         fields['description'].on_change = validate_fields
         fields['content_path'].on_change = validate_fields
@@ -220,7 +228,7 @@ class ConfigManager:
             self.load_upload_config()
             
             DialogBuilder._close_dialog(self.page, dlg)
-            self._log_message(f"新規設定を作成しました: {fields['name'].value}")
+            self._log.info(f"新規設定を作成しました: {fields['name'].value}")
             
             if self.on_config_changed:
                 self.on_config_changed()
@@ -278,6 +286,13 @@ class ConfigManager:
             if hasattr(e, 'page') and e.page:
                 e.page.update()
         
+        # App IDはSteamページボタンの更新と必須チェックの両方を行う
+        update_steam_buttons = fields['app_id'].on_change
+        
+        def on_app_id_change(e):
+            update_steam_buttons(e)
+            validate_fields(e)
+        
         # フォルダ選択ボタン（検証関数付き）
         def on_folder_selected():
             validate_fields()
@@ -291,7 +306,7 @@ class ConfigManager:
         
         # 各フィールドの変更を監視
         fields['name'].on_change = validate_fields
-        fields['app_id'].on_change = validate_fields
+        fields['app_id'].on_change = on_app_id_change
         fields['depot_id'].on_change = validate_fields
         fields['description'].on_change = validate_fields
         fields['content_path'].on_change = validate_fields
@@ -351,7 +366,7 @@ class ConfigManager:
             self.load_upload_config()
             
             DialogBuilder._close_dialog(self.page, dlg)
-            self._log_message(f"設定を更新しました: {new_name}")
+            self._log.info(f"設定を更新しました: {new_name}")
             
             if self.on_config_changed:
                 self.on_config_changed()
@@ -387,11 +402,6 @@ class ConfigManager:
         self.config_build_page_btn.disabled = not (has_config and has_app_id)
         self.config_depot_page_btn.disabled = not (has_config and has_app_id)
     
-    def _log_message(self, message: str):
-        """ログメッセージ出力"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
-    
     def update_controls_state(self, logged_in: bool):
         """ログイン状態に応じてコントロールを更新"""
         # 設定コントロールは常に使用可能
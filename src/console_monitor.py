@@ -3,7 +3,6 @@ Console monitoring functions for Steam Upload Helper.
 """
 
 import threading
-import time
 from pathlib import Path
 from utils import log_message, cleanup_temp_scripts
 from platform_helpers import ConsoleMonitor as PlatformConsoleMonitor
@@ -54,10 +53,13 @@ def start_console_monitor(helper, login_status, login_button, enable_controls_fu
                     if hasattr(helper, 'on_console_closed_callback') and helper.on_console_closed_callback:
                         helper.on_console_closed_callback()
                     
+                    # Wake up other monitors waiting on the shared condition
+                    helper.notify_monitors()
+                    
                     break
                 
                 # Check every 0.5 seconds (faster!)
-                time.sleep(0.5)
+                helper.wait_for_monitor_event(0.5)
             except Exception as e:
                 log_message(f"コンソール監視エラー: {e}")
             
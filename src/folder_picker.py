@@ -4,11 +4,12 @@ Cross-platform folder picker using native dialogs
 
 import os
 import sys
-import platform
 import subprocess
 from pathlib import Path
 from typing import Optional, Callable
 
+from platform_helpers import _SYSTEM
+
 
 def pick_folder(title: str = "フォルダを選択", callback: Optional[Callable[[str], None]] = None) -> Optional[str]:
     """
@@ -22,7 +23,7 @@ def pick_folder(title: str = "フォルダを選択", callback: Optional[Callabl
         選択されたフォルダのパス（キャンセルされた場合はNone）
     """
     try:
-        system = platform.system()
+        system = _SYSTEM
 
         if system == "Darwin":  # macOS
             # osascriptを使用してネイティブのフォルダ選択ダイアログを表示
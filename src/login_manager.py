@@ -1,13 +1,12 @@
 """Login management functionality for Steam Upload Helper"""
 
 import flet as ft
-import time
+import logging
 import threading
 from pathlib import Path
-import os
 
-from ui_helpers import DialogBuilder, ButtonStateManager
-from platform_helpers import SteamCMDLauncher, LoginMonitor
+from ui_helpers import DialogBuilder
+from platform_helpers import SteamCMDLauncher, LoginMonitor, LogChangeWatcher
 
 
 class LoginManager:
@@ -16,6 +15,7 @@ class LoginManager:
     def __init__(self, helper, page: ft.Page):
         self.helper = helper
         self.page = page
+        self._log = logging.getLogger("msuh.login")
         self.login_in_progress = False
         
         # UIコンポーネント
@@ -85,11 +85,11 @@ class LoginManager:
             return False
         
         # プラットフォーム固有のSteamCMDパス取得
-        steamcmd_path = SteamCMDLauncher.get_steamcmd_path(content_builder_path)
+        steamcmd_path = SteamCMDLauncher.find_steamcmd(content_builder_path)
         
-        if not steamcmd_path or not os.path.exists(steamcmd_path):
+        if not steamcmd_path:
             self.login_button.disabled = True
-            self.login_error_text.value = f"SteamCMDが見つかりません: {steamcmd_path if steamcmd_path else 'None'}"
+            self.login_error_text.value = f"SteamCMDが見つかりません: {SteamCMDLauncher.get_steamcmd_path(content_builder_path)}"
             self.login_error_text.visible = True
             return False
         
@@ -106,7 +106,7 @@ class LoginManager:
     def _login_button_click(self, e):
         """ログインボタンクリック処理"""
         if self.login_in_progress:
-            self._log_message("ログイン処理中...")
+            self._log.info("ログイン処理中...")
             return
         
         self.login_in_progress = True
@@ -135,7 +135,7 @@ class LoginManager:
         self.helper.steamcmd_terminal = False
         self.helper.is_logged_in = False
         
-        self._log_message("SteamCMDコンソールを起動しています...")
+        self._log.info("SteamCMDコンソールを起動しています...")
         
         # プラットフォーム固有の起動処理
         result = SteamCMDLauncher.launch_steamcmd_console(
@@ -143,7 +143,7 @@ class LoginManager:
             self.username_field.value,
             self.password_field.value,
             self.steam_guard_field.value,
-            self._log_message
+            self._log.info
         )
         
         if result.get("terminal"):
@@ -152,6 +152,9 @@ class LoginManager:
             if "process_id" in result:
                 self.helper.steamcmd_cmd_process_id = result["process_id"]
             
+            # ログフォルダの変更監視を開始し、変更時に監視ループを起こす（watchdogが無い場合はポーリングのまま）
+            LogChangeWatcher.start(on_change=self.helper.notify_monitors)
+            
             self.login_status.value = "Steamコンソールが開きました - ログインを待っています..."
             self.login_status.color = ft.Colors.ORANGE
             self.login_button.disabled = True
@@ -161,7 +164,7 @@ class LoginManager:
             
             # コンソール監視を即座に開始（ログイン前から監視する）
             if hasattr(self.helper, '_start_console_monitor_callback') and self.helper._start_console_monitor_callback:
-                self._log_message("コンソール監視をログイン前に開始します")
+                self._log.info("コンソール監視をログイン前に開始します")
                 self.helper._start_console_monitor_callback()
             
             # ログイン監視開始
@@ -187,12 +190,12 @@ class LoginManager:
             self.username_field.value,
             callbacks,
             timeout=3600,  # 1時間待機（実質無限）
-            log_callback=self._log_message
+            log_callback=self._log.info
         )
     
     def _handle_login_success(self):
         """ログイン成功時の処理"""
-        self._log_message("Steamログインが正常に完了しました！")
+        self._log.info("Steamログインが正常に完了しました！")
         self.helper.is_logged_in = True
         self.login_status.value = f"{self.username_field.value} としてログイン中"
         self.login_status.color = ft.Colors.GREEN
@@ -228,7 +231,7 @@ class LoginManager:
     
     def _handle_login_failure(self):
         """ログイン失敗時の処理"""
-        self._log_message("ログイン失敗を検出しました")
+        self._log.info("ログイン失敗を検出しました")
 
         # ログイン待機ダイアログを閉じる
         if hasattr(self, '_login_waiting_dialog') and self._login_waiting_dialog:
@@ -253,7 +256,7 @@ class LoginManager:
     
     def _handle_process_ended(self):
         """プロセス終了時の処理"""
-        self._log_message("SteamCMDプロセスが終了しました。")
+        self._log.info("SteamCMDプロセスが終了しました。")
         
         # ログイン待機ダイアログを閉じる
         if hasattr(self, '_login_waiting_dialog') and self._login_waiting_dialog:
@@ -274,11 +277,11 @@ class LoginManager:
     def _handle_login_timeout(self):
         """ログイン監視タイムアウト時の処理"""
         # タイムアウトしても待機を続ける（ダイアログは閉じない）
-        self._log_message("ログイン監視を継続しています...")
+        self._log.info("ログイン監視を継続しています...")
     
     def _handle_mobile_2fa(self):
         """モバイル2FA待機時の処理"""
-        self._log_message("モバイル認証を検出しました。Steamモバイルアプリで承認してください。")
+        self._log.info("モバイル認証を検出しました。Steamモバイルアプリで承認してください。")
         self.login_status.value = "モバイルアプリでの承認を待っています..."
         self.login_status.color = ft.Colors.ORANGE
         self.page.update()
@@ -322,15 +325,10 @@ class LoginManager:
             if file_path.exists():
                 try:
                     file_path.unlink()
-                    self._log_message(f"一時ファイルを削除: {file_path}")
+                    self._log.info(f"一時ファイルを削除: {file_path}")
                 except:
                     pass
     
-    def _log_message(self, message: str):
-        """ログメッセージ出力"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
-    
     def _show_mobile_2fa_dialog(self):
         """モバイル2FA専用のダイアログを表示"""
         # 既存のログイン待機ダイアログを閉じる
@@ -35,6 +35,7 @@ import flet as ft
 # Use absolute import for PyInstaller compatibility
 if __package__:
     from .main_app import main as app_main
+    from .utils import stop_logging
 else:
     # When running as script (e.g., via PyInstaller)
     if getattr(sys, 'frozen', False):
@@ -46,6 +47,7 @@ else:
 
     sys.path.insert(0, bundle_dir)
     from main_app import main as app_main
+    from utils import stop_logging
 
 def check_platform():
     """プラットフォームをチェックし、非対応OSの場合はエラーを表示して終了"""
@@ -118,6 +120,8 @@ if __name__ == "__main__":
             # コンソール表示の場合は入力待ち
             input("Press Enter to exit...")
     finally:
+        # ログ出力スレッドを止めてからファイルを閉じる
+        stop_logging()
         if log_file:
             log_file.flush()
             log_file.close()
\ No newline at end of file
@@ -7,8 +7,7 @@ different managers for login, configuration, upload, and system settings.
 
 import flet as ft
 import os
-import time
-import platform
+import logging
 
 from constants import *
 from steam_upload_helper import SteamUploadHelper
@@ -48,6 +47,8 @@ class SteamUploadApp:
     
     def __init__(self, page: ft.Page):
         self.page = page
+        setup_logging()
+        self._log = logging.getLogger("msuh.app")
         self.helper = SteamUploadHelper()
         
         # マネージャーの初期化
@@ -335,8 +336,8 @@ class SteamUploadApp:
     def _initialize_state(self):
         """初期状態を設定"""
         # 初期ログメッセージ
-        self._log_message("Morn Steam アップロードヘルパーへようこそ")
-        self._log_message("ツールを使用するには、まずSteamにログインしてください")
+        self._log.info("Morn Steam アップロードヘルパーへようこそ")
+        self._log.info("ツールを使用するには、まずSteamにログインしてください")
         
         # ContentBuilderパスのチェック
         self.login_manager.check_content_builder_paths()
@@ -362,15 +363,15 @@ class SteamUploadApp:
         """コンテンツフォルダを開く"""
         path = self.config_manager.content_path_field.value
         if PlatformCommands.open_folder(path):
-            self._log_message(f"フォルダを開きました: {path}")
+            self._log.info(f"フォルダを開きました: {path}")
         else:
-            self._log_message("コンテンツパスが設定されていないか、存在しません")
+            self._log.info("コンテンツパスが設定されていないか、存在しません")
     
     def _start_console_monitor_wrapper(self):
         """コンソール監視を開始（設定に応じて）"""
-        self._log_message(f"[デバッグ] コンソール監視の開始を試行... monitor_console設定: {self.helper.settings.get('monitor_console', True)}")
-        self._log_message(f"[デバッグ] start_console_monitor関数: {start_console_monitor}")
-        self._log_message(f"[デバッグ] helper.steamcmd_terminal: {self.helper.steamcmd_terminal}")
+        self._log.info(f"[デバッグ] コンソール監視の開始を試行... monitor_console設定: {self.helper.settings.get('monitor_console', True)}")
+        self._log.info(f"[デバッグ] start_console_monitor関数: {start_console_monitor}")
+        self._log.info(f"[デバッグ] helper.steamcmd_terminal: {self.helper.steamcmd_terminal}")
         
         if self.helper.settings.get("monitor_console", True) and start_console_monitor:
             try:
@@ -384,12 +385,12 @@ class SteamUploadApp:
                     self._enable_controls,
                     self.page
                 )
-                self._log_message("コンソール監視を開始しました")
-                self._log_message(f"[デバッグ] 監視スレッド: {self.console_monitor_wrapper}")
+                self._log.info("コンソール監視を開始しました")
+                self._log.info(f"[デバッグ] 監視スレッド: {self.console_monitor_wrapper}")
             except Exception as e:
-                self._log_message(f"コンソール監視の開始に失敗: {e}")
+                self._log.info(f"コンソール監視の開始に失敗: {e}")
                 import traceback
-                self._log_message(f"[デバッグ] トレースバック: {traceback.format_exc()}")
+                self._log.info(f"[デバッグ] トレースバック: {traceback.format_exc()}")
     
     # コールバックハンドラー
     def _handle_login_success(self):
@@ -423,12 +424,12 @@ class SteamUploadApp:
     
     def _handle_console_closed(self):
         """コンソールが閉じられた時の処理"""
-        self._log_message("コンソールが閉じられました")
+        self._log.info("コンソールが閉じられました")
         
         # ログイン監視を停止
         from platform_helpers import LoginMonitor
         LoginMonitor.stop_monitoring()
-        self._log_message("ログイン監視を停止しました")
+        self._log.info("ログイン監視を停止しました")
         
         # ログイン待機ダイアログを閉じる
         if hasattr(self.login_manager, '_login_waiting_dialog') and self.login_manager._login_waiting_dialog:
@@ -449,13 +450,15 @@ class SteamUploadApp:
         self._enable_controls(False)
         
         self.page.update()
-    
-    def _log_message(self, message: str):
-        """ログメッセージ出力"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
 
 
 def main(page: ft.Page):
     """アプリケーションエントリーポイント"""
-    app = SteamUploadApp(page)
\ No newline at end of file
+    app = SteamUploadApp(page)
+    
+    # ページ終了時に監視処理とフォルダ選択用のワーカーを停止
+    def on_disconnect(e):
+        app.upload_manager.close()
+        app.system_settings_manager.close()
+    
+    page.on_disconnect = on_disconnect
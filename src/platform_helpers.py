@@ -1,12 +1,35 @@
 """Platform-specific helper functions for Steam Upload Helper"""
 
+import atexit
+import functools
 import os
 import platform
 import subprocess
+import tempfile
 import threading
 import time
 from pathlib import Path
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdogが無い環境ではログファイルを毎回ポーリングする
+    FileSystemEventHandler = object
+    Observer = None
+
+# 実行中にOSが変わることはないので起動時に1度だけ判定する
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_MAC = _SYSTEM == "Darwin"
+
+# SteamCMDの配置先 (builderフォルダ, 実行ファイル名)
+_STEAMCMD_LOCATIONS = {
+    "Darwin": ("builder_osx", "steamcmd.sh"),
+    "Windows": ("builder", "steamcmd.exe"),
+}
+_STEAMCMD_LOCATION = _STEAMCMD_LOCATIONS.get(_SYSTEM, ("builder_linux", "steamcmd.sh"))
+
 
 class SteamCMDLauncher:
     """プラットフォーム固有のSteamCMD起動処理を管理"""
@@ -14,18 +37,23 @@ class SteamCMDLauncher:
     @staticmethod
     def get_steamcmd_path(content_builder_path: str) -> str:
         """プラットフォームに応じたSteamCMDパスを取得"""
-        if platform.system() == "Darwin":  # macOS
-            return os.path.join(content_builder_path, "builder_osx", "steamcmd.sh")
-        elif platform.system() == "Windows":
-            return os.path.join(content_builder_path, "builder", "steamcmd.exe")
-        else:  # Linux
-            return os.path.join(content_builder_path, "builder_linux", "steamcmd.sh")
+        return os.path.join(content_builder_path, *_STEAMCMD_LOCATION)
+    
+    @staticmethod
+    def find_steamcmd(content_builder_path: str):
+        """SteamCMDが存在すればそのパスを返す（存在しなければNone）"""
+        steamcmd_path = SteamCMDLauncher.get_steamcmd_path(content_builder_path)
+        try:
+            os.stat(steamcmd_path)
+        except (OSError, ValueError):
+            return None
+        return steamcmd_path
     
     @staticmethod
     def launch_steamcmd_console(steamcmd_path: str, username: str, password: str, 
                               steam_guard: str = "", log_callback=None):
         """SteamCMDコンソールを起動"""
-        system = platform.system()
+        system = _SYSTEM
         
         if system == "Darwin":
             return SteamCMDLauncher._launch_macos(steamcmd_path, username, password, steam_guard, log_callback)
@@ -188,7 +216,7 @@ class LoginMonitor:
         LoginMonitor._stop_monitoring = False
         
         def monitor_thread():
-            system = platform.system()
+            system = _SYSTEM
             
             if log_callback:
                 log_callback(f"[ログイン監視] スレッド開始 (Platform: {system})")
@@ -515,26 +543,25 @@ class PlatformUtilities:
     
     @staticmethod
     def open_folder(path: str) -> bool:
-        """フォルダをOSのデフォルトアプリで開く"""
+        """フォルダをOSのデフォルトアプリで開く（ファイルマネージャーの終了は待たない）"""
         if not path or not os.path.exists(path):
             return False
         
-        system = platform.system()
         try:
-            if system == "Darwin":
-                subprocess.run(["open", path])
-            elif system == "Windows":
-                subprocess.run(["explorer", path])
-            else:  # Linux
-                subprocess.run(["xdg-open", path])
+            if _IS_WINDOWS:
+                os.startfile(path)
+            else:
+                subprocess.Popen(["open" if _IS_MAC else "xdg-open", path],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
             return True
-        except:
+        except OSError:
             return False
     
     @staticmethod
     def copy_to_clipboard(text: str) -> bool:
         """テキストをクリップボードにコピー"""
-        system = platform.system()
+        system = _SYSTEM
         try:
             if system == "Darwin":
                 process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
@@ -552,7 +579,7 @@ class PlatformUtilities:
     @staticmethod
     def get_platform_terminal_command(working_dir: str, script_path: str) -> list:
         """プラットフォーム固有のターミナル起動コマンドを取得"""
-        system = platform.system()
+        system = _SYSTEM
         
         if system == "Darwin":
             return ['osascript', '-e', f'tell application "Terminal" to do script "cd {working_dir} && {script_path}"']
@@ -564,7 +591,7 @@ class PlatformUtilities:
     @staticmethod
     def is_process_running(process_name: str) -> bool:
         """指定したプロセスが実行中か確認"""
-        system = platform.system()
+        system = _SYSTEM
         try:
             if system == "Windows":
                 result = subprocess.run(
@@ -584,13 +611,260 @@ class PlatformUtilities:
             return False
 
 
+@functools.lru_cache(maxsize=None)
+def _webbrowser():
+    """webbrowserモジュールを初回使用時にだけ読み込む"""
+    import webbrowser
+    return webbrowser
+
+
+@functools.lru_cache(maxsize=16)
+def _build_error_script(patterns_tuple: tuple) -> str:
+    """エラーパターン検出用のAppleScriptを生成（パターンの組ごとにキャッシュ）"""
+    # 各パターンに対してダブルクォートをエスケープ
+    escaped_patterns = [pattern.replace('"', '\\"') for pattern in patterns_tuple]
+    patterns_condition = ' or '.join([f'tabContent contains "{pattern}"' for pattern in escaped_patterns])
+    return f'''
+    tell application "Terminal"
+        set errorFound to false
+        try
+            repeat with w in windows
+                try
+                    set tabContent to contents of selected tab of w
+                    if tabContent contains "steamcmd" or tabContent contains "Steam>" then
+                        if {patterns_condition} then
+                            set errorFound to true
+                            exit repeat
+                        end if
+                    end if
+                end try
+            end repeat
+        end try
+        return errorFound
+    end tell
+    '''
+
+
+# エラーパターン検出用AppleScript（パターンはosascriptの引数argvで受け取る）
+_ERROR_CHECK_APPLESCRIPT = '''
+on run argv
+    tell application "Terminal"
+        set errorFound to false
+        try
+            repeat with w in windows
+                try
+                    set tabContent to contents of selected tab of w
+                    if tabContent contains "steamcmd" or tabContent contains "Steam>" then
+                        repeat with p in argv
+                            if tabContent contains (p as text) then
+                                set errorFound to true
+                                exit repeat
+                            end if
+                        end repeat
+                        if errorFound then exit repeat
+                    end if
+                end try
+            end repeat
+        end try
+        return errorFound
+    end tell
+end run
+'''
+
+
+def _remove_file(path: str):
+    """終了時に一時ファイルを削除"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _error_log_candidates() -> list:
+    """エラーパターン検出で参照するconsole_log.txtの候補パス"""
+    return [
+        Path.cwd() / "logs" / "console_log.txt",
+        Path.cwd().parent / "logs" / "console_log.txt",
+    ]
+
+
+class _ConsoleLogEventHandler(FileSystemEventHandler):
+    """console_log.txtへの書き込みを検出して変更回数を進め、待機中の監視ループを起こす"""
+
+    def __init__(self, on_change=None):
+        super().__init__()
+        self._on_change = on_change
+
+    def on_modified(self, event):
+        if os.path.basename(event.src_path) == "console_log.txt":
+            LogChangeWatcher._change_count += 1
+            if self._on_change:
+                self._on_change()
+
+    on_created = on_modified
+
+
+class LogTailer:
+    """ログファイルを前回の読み取り位置から追記分だけ読み込む"""
+
+    RESIDUAL_SIZE = 256  # 読み取りの境界をまたぐパターン用に残す末尾のバイト数
+
+    def __init__(self, path: str, from_end: bool = True):
+        self.path = path
+        self.offset = 0
+        self.residual_tail = b""
+        self.window = b""  # 最後に読み込んだ範囲（前回の末尾 + 追記分）
+        if from_end:
+            # 開始前の出力は対象外にする
+            try:
+                self.offset = os.path.getsize(path)
+            except OSError:
+                self.offset = 0
+
+    def poll(self) -> bytes:
+        """追記分を読み込んでwindowを更新"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, 2)
+                if f.tell() < self.offset:
+                    # ファイルが作り直された場合は先頭から読む
+                    self.offset = 0
+                    self.residual_tail = b""
+                f.seek(self.offset)
+                chunk = f.read()
+                self.offset = f.tell()
+        except OSError:
+            chunk = b""
+
+        self.window = self.residual_tail + chunk
+        self.residual_tail = self.window[-self.RESIDUAL_SIZE:]
+        return self.window
+
+    def search(self, regex) -> bool:
+        """最後に読み込んだ範囲がコンパイル済みのbytes正規表現にマッチするか"""
+        return regex.search(self.window) is not None
+
+
+class LogChangeWatcher:
+    """OSのファイル変更通知（ReadDirectoryChangesW / FSEvents）でログフォルダを監視"""
+
+    _observer = None
+    _change_count = 0  # 監視スレッドだけが増やすログの変更回数
+
+    @staticmethod
+    def start(on_change=None) -> bool:
+        """ログフォルダの監視を開始し、変更のたびにon_changeを呼ぶ（watchdogが無い場合やフォルダが無い場合はFalse）"""
+        if Observer is None:
+            return False
+        if LogChangeWatcher._observer is not None:
+            return True
+
+        log_dirs = {str(p.parent) for p in _error_log_candidates() if p.parent.is_dir()}
+        if not log_dirs:
+            return False
+
+        try:
+            observer = Observer()
+            handler = _ConsoleLogEventHandler(on_change)
+            for log_dir in log_dirs:
+                observer.schedule(handler, log_dir, recursive=False)
+            observer.daemon = True
+            observer.start()
+        except Exception:
+            return False
+
+        LogChangeWatcher._observer = observer
+        atexit.register(LogChangeWatcher.stop)
+        return True
+
+    @staticmethod
+    def stop():
+        """ログフォルダの監視を停止"""
+        observer = LogChangeWatcher._observer
+        LogChangeWatcher._observer = None
+        if observer is not None:
+            try:
+                observer.stop()
+                observer.join(timeout=1.0)
+            except Exception:
+                pass
+
+    @staticmethod
+    def is_active() -> bool:
+        """監視中かどうか"""
+        return LogChangeWatcher._observer is not None
+
+    @staticmethod
+    def change_count() -> int:
+        """これまでに検出したログの変更回数（呼び出し側が前回値と比較する）"""
+        return LogChangeWatcher._change_count
+
+
 class ConsoleMonitor:
     """プラットフォーム固有のコンソール監視処理"""
     
+    _compiled_error_script = None  # コンパイル済み.scptのパス（失敗時はFalse）
+    _last_error_results = {}  # パターンの組ごとの前回のWindowsログ検出結果
+    _last_error_changes = {}  # パターンの組ごとに前回確認した時点のログ変更回数
+    _error_log_path = None  # 解決済みのWindowsログパス
+    _error_log_resolved_at = 0.0  # 最後にログパスを探した時刻
+    _ERROR_LOG_RETRY_INTERVAL = 10.0  # ログが見つからない場合の再探索間隔（秒）
+    
+    @staticmethod
+    def _resolve_error_log_path():
+        """エラーパターン検出用のログパスを解決（見つからない間は10秒ごとに再探索）"""
+        if ConsoleMonitor._error_log_path is None:
+            now = time.monotonic()
+            if (ConsoleMonitor._error_log_resolved_at
+                    and now - ConsoleMonitor._error_log_resolved_at < ConsoleMonitor._ERROR_LOG_RETRY_INTERVAL):
+                return None
+            ConsoleMonitor._error_log_resolved_at = now
+            for log_path in _error_log_candidates():
+                if log_path.exists():
+                    ConsoleMonitor._error_log_path = str(log_path)
+                    break
+        return ConsoleMonitor._error_log_path
+
+    @staticmethod
+    def _read_log_tail(log_path: str, size: int) -> bytes:
+        """ログファイルの末尾sizeバイトをデコードせずに読む"""
+        with open(log_path, 'rb') as f:
+            f.seek(0, 2)
+            f.seek(max(0, f.tell() - size))
+            return f.read()
+
+    @staticmethod
+    def _get_compiled_error_script():
+        """エラーパターン検出用AppleScriptを初回のみosacompileでコンパイル"""
+        if ConsoleMonitor._compiled_error_script is None:
+            # 複数起動しても互いのファイルを消さないよう、プロセスごとの一時ファイルを使う
+            source_fd, source_path = tempfile.mkstemp(prefix="morn_check_", suffix=".applescript")
+            compiled_fd, compiled_path = tempfile.mkstemp(prefix="morn_check_", suffix=".scpt")
+            os.close(compiled_fd)
+            try:
+                with os.fdopen(source_fd, 'w', encoding='utf-8') as f:
+                    f.write(_ERROR_CHECK_APPLESCRIPT)
+                result = subprocess.run(
+                    ['osacompile', '-o', compiled_path, source_path],
+                    capture_output=True, text=True
+                )
+                if result.returncode == 0:
+                    ConsoleMonitor._compiled_error_script = compiled_path
+                    atexit.register(_remove_file, compiled_path)
+                else:
+                    ConsoleMonitor._compiled_error_script = False
+                    _remove_file(compiled_path)
+            except Exception:
+                ConsoleMonitor._compiled_error_script = False
+                _remove_file(compiled_path)
+            finally:
+                _remove_file(source_path)
+        return ConsoleMonitor._compiled_error_script
+    
     @staticmethod
     def check_steam_prompt(steamcmd_path: str = None, log_callback=None) -> bool:
         """Steam>プロンプトが表示されているかチェック"""
-        system = platform.system()
+        system = _SYSTEM
         
         try:
             if system == "Darwin":  # macOS
@@ -747,68 +1021,50 @@ class ConsoleMonitor:
     @staticmethod
     def check_for_error_pattern(patterns: list) -> bool:
         """コンソール出力にエラーパターンが含まれているかチェック"""
-        system = platform.system()
+        system = _SYSTEM
 
         try:
             if system == "Darwin":  # macOS
-                # AppleScriptでTerminalの内容をチェック
-                # 各パターンに対してダブルクォートをエスケープ
-                escaped_patterns = [pattern.replace('"', '\\"') for pattern in patterns]
-                patterns_condition = ' or '.join([f'tabContent contains "{pattern}"' for pattern in escaped_patterns])
-                check_script = f'''
-                tell application "Terminal"
-                    set errorFound to false
-                    try
-                        repeat with w in windows
-                            try
-                                set tabContent to contents of selected tab of w
-                                if tabContent contains "steamcmd" or tabContent contains "Steam>" then
-                                    if {patterns_condition} then
-                                        set errorFound to true
-                                        exit repeat
-                                    end if
-                                end if
-                            end try
-                        end repeat
-                    end try
-                    return errorFound
-                end tell
-                '''
+                # コンパイル済みAppleScriptにパターンを引数で渡してTerminalの内容をチェック
+                compiled_script = ConsoleMonitor._get_compiled_error_script()
+                if compiled_script:
+                    command = ['osascript', compiled_script, *patterns]
+                else:
+                    # コンパイルに失敗した場合はスクリプト文字列を直接実行（パターンの組ごとにキャッシュ）
+                    command = ['osascript', '-e', _build_error_script(tuple(patterns))]
 
-                result = subprocess.run(
-                    ['osascript', '-e', check_script],
-                    capture_output=True, text=True
-                )
+                result = subprocess.run(command, capture_output=True, text=True)
 
                 return result.returncode == 0 and result.stdout.strip() == "true"
 
             elif system == "Windows":
                 # Windowsではログファイルから最新の内容を確認
-                # 簡易的なチェック - 最新のログファイルを読む
-                log_files = [
-                    str(Path.cwd() / "logs" / "console_log.txt"),
-                    str(Path.cwd().parent / "logs" / "console_log.txt"),
-                ]
+                key = tuple(patterns)
 
-                for log_path in log_files:
-                    if os.path.exists(log_path):
-                        try:
-                            with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                # 最後の1000バイトを読む
-                                f.seek(0, 2)
-                                file_size = f.tell()
-                                read_size = min(1000, file_size)
-                                f.seek(max(0, file_size - read_size))
-                                last_content = f.read()
-
-                                # エラーパターンをチェック
-                                for pattern in patterns:
-                                    if pattern in last_content:
-                                        return True
-                        except:
-                            continue
+                # ログフォルダを監視中で、このパターンの組の前回確認以降に変更が無ければ前回の結果を返す
+                change_count = LogChangeWatcher.change_count()
+                if (LogChangeWatcher.is_active()
+                        and ConsoleMonitor._last_error_changes.get(key) == change_count):
+                    return ConsoleMonitor._last_error_results.get(key, False)
 
-                return False
+                log_path = ConsoleMonitor._resolve_error_log_path()
+                if log_path is None:
+                    return False
+
+                try:
+                    # 最後の1000バイトをバイト列のままエラーパターンと照合
+                    last_content = ConsoleMonitor._read_log_tail(log_path, 1000)
+                    found = any(pattern.encode('utf-8') in last_content for pattern in patterns)
+                except OSError:
+                    # ログが消えた場合は次回から探し直す
+                    ConsoleMonitor._error_log_path = None
+                    ConsoleMonitor._error_log_resolved_at = 0.0
+                    return False
+
+                # 読み取れた場合だけ確認済みにする（ログ未検出の間の変更を取りこぼさない）
+                ConsoleMonitor._last_error_results[key] = found
+                ConsoleMonitor._last_error_changes[key] = change_count
+                return found
 
             else:  # Linux
                 # Linux版は未実装
@@ -817,10 +1073,26 @@ class ConsoleMonitor:
         except Exception:
             return False
 
+    @staticmethod
+    def find_log_path(steamcmd_path: str = None):
+        """完了メッセージを検出するconsole_log.txtのパスを取得（Windows以外や見つからない場合はNone）"""
+        if _SYSTEM != "Windows":
+            return None
+
+        if steamcmd_path:
+            log_files = LoginMonitor._get_log_files(steamcmd_path)
+        else:
+            log_files = [str(p) for p in _error_log_candidates()]
+
+        for log_path in log_files:
+            if os.path.basename(log_path) == "console_log.txt" and os.path.exists(log_path):
+                return log_path
+        return None
+
     @staticmethod
     def check_for_pattern(pattern: str, steamcmd_path: str = None) -> bool:
         """コンソール出力に特定のパターンが含まれているかチェック（単一パターン版）"""
-        system = platform.system()
+        system = _SYSTEM
 
         try:
             if system == "Darwin":  # macOS
@@ -864,20 +1136,13 @@ class ConsoleMonitor:
                         str(Path.cwd().parent / "logs" / "console_log.txt"),
                     ])
 
+                pattern_bytes = pattern.encode('utf-8')
                 for log_path in log_files:
                     if os.path.exists(log_path):
                         try:
-                            with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                # 最後の2000バイトを読む（完了メッセージは長い可能性がある）
-                                f.seek(0, 2)
-                                file_size = f.tell()
-                                read_size = min(2000, file_size)
-                                f.seek(max(0, file_size - read_size))
-                                last_content = f.read()
-
-                                # パターンをチェック
-                                if pattern in last_content:
-                                    return True
+                            # 最後の2000バイトを読む（完了メッセージは長い可能性がある）
+                            if pattern_bytes in ConsoleMonitor._read_log_tail(log_path, 2000):
+                                return True
                         except:
                             continue
 
@@ -893,7 +1158,7 @@ class ConsoleMonitor:
     @staticmethod
     def check_console_status(monitor_count: int, grace_period_checks: int) -> dict:
         """コンソールの状態をチェック"""
-        system = platform.system()
+        system = _SYSTEM
         result = {'closed': False, 'log_message': None}
         
         try:
@@ -994,181 +1259,3 @@ class ConsoleMonitor:
             result['log_message'] = f"コンソールチェックエラー: {e}"
             
         return result
-
-
-class WindowsCommandSender:
-    """Windows環境でのコマンド送信処理"""
-    
-    @staticmethod
-    def send_command_to_console(command: str, process_id: int = None, log_callback=None) -> bool:
-        """コンソールウィンドウにコマンドを送信"""
-        if platform.system() != "Windows":
-            return False
-        
-        try:
-            # PowerShellスクリプトでコマンドを送信
-            escaped_command = command.replace('"', '`"').replace("'", "''")
-            
-            ps_script = f'''
-Add-Type -AssemblyName System.Windows.Forms
-
-Add-Type @"
-    using System;
-    using System.Runtime.InteropServices;
-    using System.Text;
-
-    public class InputHelper {{
-        [DllImport("user32.dll")]
-        public static extern bool EnumWindows(EnumWindowsProc enumProc, IntPtr lParam);
-
-        [DllImport("user32.dll")]
-        public static extern int GetWindowText(IntPtr hWnd, StringBuilder lpString, int nMaxCount);
-
-        [DllImport("user32.dll")]
-        public static extern uint GetWindowThreadProcessId(IntPtr hWnd, out uint lpdwProcessId);
-
-        [DllImport("user32.dll")]
-        public static extern bool IsWindowVisible(IntPtr hWnd);
-
-        [DllImport("user32.dll")]
-        public static extern bool SetForegroundWindow(IntPtr hWnd);
-
-        [DllImport("user32.dll")]
-        public static extern IntPtr GetForegroundWindow();
-
-        [DllImport("user32.dll")]
-        public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
-
-        [DllImport("imm32.dll")]
-        public static extern IntPtr ImmGetContext(IntPtr hWnd);
-
-        [DllImport("imm32.dll")]
-        public static extern bool ImmReleaseContext(IntPtr hWnd, IntPtr hIMC);
-
-        [DllImport("imm32.dll")]
-        public static extern bool ImmGetOpenStatus(IntPtr hIMC);
-
-        [DllImport("imm32.dll")]
-        public static extern bool ImmSetOpenStatus(IntPtr hIMC, bool fOpen);
-
-        public delegate bool EnumWindowsProc(IntPtr hWnd, IntPtr lParam);
-
-        public const int SW_RESTORE = 9;
-    }}
-"@
-
-# Find console window
-$candidates = @()
-$callback = {{
-    param($hWnd, $lParam)
-    $sb = New-Object System.Text.StringBuilder 256
-    [InputHelper]::GetWindowText($hWnd, $sb, $sb.Capacity) | Out-Null
-    $title = $sb.ToString()
-
-    if ([InputHelper]::IsWindowVisible($hWnd)) {{
-        if ($title -like "*steamcmd*" -or $title -like "*MornSteamCMD*") {{
-            $procId = 0
-            [InputHelper]::GetWindowThreadProcessId($hWnd, [ref]$procId) | Out-Null
-            $proc = Get-Process -Id $procId -ErrorAction SilentlyContinue
-
-            $obj = [PSCustomObject]@{{
-                Handle = $hWnd
-                Title = $title
-                PID = $procId
-                ProcessName = if ($proc) {{ $proc.ProcessName }} else {{ "Unknown" }}
-            }}
-            $script:candidates += $obj
-        }}
-    }}
-    return $true
-}}
-
-$candidates = @()
-[InputHelper]::EnumWindows($callback, [IntPtr]::Zero) | Out-Null
-
-if ($candidates.Count -eq 0) {{
-    Write-Output "NOTFOUND"
-    exit 1
-}}
-
-# Select best candidate
-$targetWindow = $null
-foreach ($cand in $candidates) {{
-    if ($cand.Title -like "*MornSteamCMD*") {{
-        $targetWindow = $cand
-        break
-    }}
-}}
-if ($targetWindow -eq $null) {{
-    foreach ($cand in $candidates) {{
-        if ($cand.ProcessName -eq "conhost") {{
-            $targetWindow = $cand
-            break
-        }}
-    }}
-}}
-if ($targetWindow -eq $null) {{
-    $targetWindow = $candidates[0]
-}}
-
-# Save current foreground window
-$originalWindow = [InputHelper]::GetForegroundWindow()
-
-# Focus and send (minimal delay)
-[InputHelper]::SetForegroundWindow($targetWindow.Handle) | Out-Null
-Start-Sleep -Milliseconds 80
-
-try {{
-    # Copy command to clipboard
-    Set-Clipboard -Value "{escaped_command}"
-
-    # Force disable IME using Windows API
-    $hIMC = [InputHelper]::ImmGetContext($targetWindow.Handle)
-    if ($hIMC -ne [IntPtr]::Zero) {{
-        $imeStatus = [InputHelper]::ImmGetOpenStatus($hIMC)
-        if ($imeStatus) {{
-            # IME is ON, turn it OFF
-            [InputHelper]::ImmSetOpenStatus($hIMC, $false) | Out-Null
-        }}
-        [InputHelper]::ImmReleaseContext($targetWindow.Handle, $hIMC) | Out-Null
-    }}
-    Start-Sleep -Milliseconds 50
-
-    # Paste from clipboard (supports Japanese) + enter
-    [System.Windows.Forms.SendKeys]::SendWait("^v{{ENTER}}")
-    Write-Output "SUCCESS"
-}} catch {{
-    Write-Output "ERROR: $_"
-    exit 1
-}} finally {{
-    # Restore immediately
-    if ($originalWindow -ne [IntPtr]::Zero) {{
-        [InputHelper]::SetForegroundWindow($originalWindow) | Out-Null
-    }}
-}}
-'''
-            
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-Command', ps_script],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            
-            if "SUCCESS" in result.stdout:
-                if log_callback:
-                    log_callback(f"✓ コマンドを自動送信しました: {command}")
-                return True
-            elif "NOTFOUND" in result.stdout:
-                if log_callback:
-                    log_callback("✗ エラー: SteamCMDコンソールウィンドウが見つかりませんでした。")
-                return False
-            else:
-                if log_callback:
-                    log_callback(f"✗ 自動送信エラー: {result.stderr}")
-                return False
-            
-        except Exception as e:
-            if log_callback:
-                log_callback(f"コマンド送信エラー: {e}")
-            return False
\ No newline at end of file
@@ -3,10 +3,33 @@ Steam Upload Helper class for managing Steam uploads.
 """
 
 import json
+import os
 import queue
+import threading
+import time
 from pathlib import Path
 from constants import CONFIG_DIR, VDF_DIR
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard json module
+    orjson = None
+
+
+def _json_load(path):
+    """Read JSON from path (orjson if available)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data.decode('utf-8'))
+
+
+def _json_dump(obj, path):
+    """Write obj to path as compact JSON."""
+    text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
 
 class SteamUploadHelper:
     """
@@ -39,35 +62,43 @@ class SteamUploadHelper:
         self.output_queue = queue.Queue()
         self.console_monitor_thread = None
         self.steamcmd_terminal = False
+        # 監視ループ共通の待機用条件変数（イベント発生時にまとめて起こす）
+        self._monitor_cv = threading.Condition()
         
         # Create necessary directories
         self.vdf_dir.mkdir(exist_ok=True)
         
+    def wait_for_monitor_event(self, timeout):
+        """Sleep up to timeout seconds, returning early when monitors are notified."""
+        with self._monitor_cv:
+            self._monitor_cv.wait(timeout=timeout)
+    
+    def notify_monitors(self):
+        """Wake up every monitor loop waiting in wait_for_monitor_event."""
+        with self._monitor_cv:
+            self._monitor_cv.notify_all()
+    
     def load_settings(self):
         """Load user settings from JSON file."""
         if self.settings_file.exists():
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_load(self.settings_file)
         return {}
     
     def save_settings(self):
         """Save user settings to JSON file."""
         self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.settings_file, 'w', encoding='utf-8') as f:
-            json.dump(self.settings, f, indent=2, ensure_ascii=False)
+        _json_dump(self.settings, self.settings_file)
     
     def load_upload_configs(self):
         """Load upload configurations from JSON file."""
         if self.upload_configs_file.exists():
-            with open(self.upload_configs_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_load(self.upload_configs_file)
         return {}
     
     def save_upload_configs(self):
         """Save upload configurations to JSON file."""
         self.upload_configs_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.upload_configs_file, 'w', encoding='utf-8') as f:
-            json.dump(self.upload_configs, f, indent=2, ensure_ascii=False)
+        _json_dump(self.upload_configs, self.upload_configs_file)
     
     def save_upload_config(self, name, config):
         """Save a single upload configuration."""
@@ -82,9 +113,6 @@ class SteamUploadHelper:
     
     def create_vdf_file(self, config_name, config):
         """Create VDF files for Steam upload."""
-        import os
-        import time
-        
         # Get required values
         app_id = config.get("app_id", "")
         depot_id = config.get("depot_id", "")
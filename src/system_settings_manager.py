@@ -1,8 +1,10 @@
 """System settings management for Steam Upload Helper"""
 
 import flet as ft
+import functools
+import logging
 import os
-import platform
+import queue
 import threading
 from pathlib import Path
 
@@ -11,6 +13,19 @@ from platform_helpers import SteamCMDLauncher
 from command_sender import CommandSender
 from folder_picker import pick_folder
 
+# ContentBuilderフォルダに含まれるプラットフォーム別のbuilderフォルダ
+_BUILDER_FOLDERS = frozenset(("builder", "builder_osx", "builder_linux"))
+
+
+@functools.lru_cache(maxsize=64)
+def _has_builder_folder(path: str, mtime: float) -> bool:
+    """builderフォルダを含むか判定（フォルダの更新時刻ごとにキャッシュ）"""
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name in _BUILDER_FOLDERS and entry.is_dir() for entry in entries)
+    except OSError:
+        return False
+
 
 class SystemSettingsManager:
     """システム設定を管理するクラス"""
@@ -18,33 +33,82 @@ class SystemSettingsManager:
     def __init__(self, helper, page: ft.Page):
         self.helper = helper
         self.page = page
+        self._log = logging.getLogger("msuh.settings")
         
         # UIコンポーネント
         self.steamcmd_path_text = None
         self.build_output_path_text = None
         
+        # 基本設定ダイアログ（初回表示時に一度だけ構築）
+        self._settings_dlg = None
+        self._cb_field = None
+        self._out_field = None
+        self._opened_cb_path = ""
+        
         # コールバック
         self.on_settings_changed = None
+        
+        # フォルダ選択ダイアログ用のワーカー（同時に開くのは1つだけ、終了を妨げないようデーモン）
+        self._picker_queue = queue.Queue()
+        self._picker_thread = None
+    
+    def close(self):
+        """フォルダ選択用のワーカーを停止"""
+        self._picker_queue.put(None)
+    
+    def _submit_picker(self, run_picker):
+        """フォルダ選択をワーカースレッドで順番に実行"""
+        if self._picker_thread is None:
+            self._picker_thread = threading.Thread(
+                target=self._picker_loop, name='folder-picker', daemon=True
+            )
+            self._picker_thread.start()
+        self._picker_queue.put(run_picker)
+    
+    def _picker_loop(self):
+        """キューに積まれたフォルダ選択を1つずつ処理"""
+        while True:
+            run_picker = self._picker_queue.get()
+            if run_picker is None:
+                return
+            try:
+                run_picker()
+            except Exception:
+                self._log.exception("フォルダ選択でエラーが発生しました")
     
     def create_ui_components(self):
         """システム設定関連のUIコンポーネントを作成"""
+        settings = self.helper.settings
         self.steamcmd_path_text = ft.Text(
-            value=self.helper.settings.get("steamcmd_path", "SteamCMDが選択されていません"),
+            value=settings.get("steamcmd_path", "SteamCMDが選択されていません"),
             size=12
         )
         
         self.build_output_path_text = ft.Text(
-            value=self.helper.settings.get("build_output_path", "未設定"),
+            value=settings.get("build_output_path", "未設定"),
             size=12
         )
     
     def show_system_settings_dialog(self):
         """システム設定ダイアログを表示"""
+        if self._settings_dlg is None:
+            self._build_system_settings_dialog()
+            DialogBuilder.open_dialog(self.page, self._settings_dlg, update=False)
+        
+        # 現在の設定値をフィールドに反映
+        settings = self.helper.settings
+        self._opened_cb_path = settings.get("content_builder_path", "")
+        self._cb_field.value = self._opened_cb_path
+        self._out_field.value = settings.get("build_output_path", "")
+        
+        self._settings_dlg.open = True
+        self.page.update()
+    
+    def _build_system_settings_dialog(self):
+        """システム設定ダイアログのコントロールを構築"""
         # Content Builder Path
-        content_builder_path = self.helper.settings.get("content_builder_path", "")
         content_builder_field = ft.TextField(
             label="Content Builder フォルダパス",
-            value=content_builder_path,
             read_only=True,
             hint_text="SteamCMD ContentBuilderフォルダを選択"
         )
@@ -64,8 +128,8 @@ class SystemSettingsManager:
                             "'builder' または 'builder_osx' フォルダを含む必要があります。"
                         )
 
-            # Run in separate thread to avoid blocking UI
-            threading.Thread(target=run_picker, daemon=True).start()
+            # Run in the picker worker to avoid blocking UI
+            self._submit_picker(run_picker)
         
         select_cb_btn = ft.IconButton(
             ft.Icons.FOLDER_OPEN,
@@ -76,7 +140,6 @@ class SystemSettingsManager:
         # Build Output Path  
         build_output_field = ft.TextField(
             label="ビルド出力フォルダ（オプション）",
-            value=self.helper.settings.get("build_output_path", ""),
             read_only=True,
             hint_text="ビルドログの保存先"
         )
@@ -88,8 +151,8 @@ class SystemSettingsManager:
                     build_output_field.value = folder_path
                     dlg.update()
 
-            # Run in separate thread to avoid blocking UI
-            threading.Thread(target=run_picker, daemon=True).start()
+            # Run in the picker worker to avoid blocking UI
+            self._submit_picker(run_picker)
         
         select_output_btn = ft.IconButton(
             ft.Icons.FOLDER_OPEN,
@@ -119,7 +182,7 @@ class SystemSettingsManager:
             # テストを実行
             success = CommandSender.test_send_help(
                 steamcmd_path,
-                self._log_message
+                self._log.info
             )
             
             if success:
@@ -143,90 +206,73 @@ class SystemSettingsManager:
         def save_settings(e):
             # ContentBuilder pathを保存
             new_cb_path = content_builder_field.value
-            if new_cb_path != content_builder_path:
+            if new_cb_path != self._opened_cb_path:
                 self.helper.settings["content_builder_path"] = new_cb_path
                 
                 # SteamCMDパスを自動更新
-                steamcmd_path = SteamCMDLauncher.get_steamcmd_path(new_cb_path)
-                if steamcmd_path and os.path.exists(steamcmd_path):
+                steamcmd_path = SteamCMDLauncher.find_steamcmd(new_cb_path)
+                if steamcmd_path:
                     self.helper.settings["steamcmd_path"] = steamcmd_path
                     self.steamcmd_path_text.value = steamcmd_path
-                    self._log_message(f"SteamCMDパスを更新: {steamcmd_path}")
+                    self._log.info(f"SteamCMDパスを更新: {steamcmd_path}")
             
             # その他の設定を保存
             self.helper.settings["build_output_path"] = build_output_field.value
             
             self.helper.save_settings()
             
-            # UIを更新
+            # UIを更新（ダイアログの切り替えと同じ更新で反映）
             self.build_output_path_text.value = build_output_field.value or "未設定"
-            self.page.update()
-            
-            DialogBuilder._close_dialog(self.page, dlg)
-            DialogBuilder.show_success_dialog(self.page, "設定を保存しました")
+            DialogBuilder.replace_dialog(
+                self.page, dlg, DialogBuilder.build_success_dialog(self.page, "設定を保存しました")
+            )
             
             if self.on_settings_changed:
                 self.on_settings_changed()
         
         # ダイアログ内容
         content = ft.Column([
-            ft.Container(
-                content=ft.Column([
-                    ft.Text("SteamCMD設定", size=16, weight=ft.FontWeight.BOLD),
-                    ft.Row([content_builder_field, select_cb_btn]),
-                    ft.Text(
-                        "※ ContentBuilderフォルダはbuilder/builder_osx/builder_linuxを含むフォルダです",
-                        size=11,
-                        color=ft.Colors.GREY
-                    ),
-                    ft.Container(height=10),
-                    test_help_btn,
-                ]),
-                padding=ft.padding.only(bottom=20)
+            ft.Text("SteamCMD設定", size=16, weight=ft.FontWeight.BOLD),
+            ft.Row([content_builder_field, select_cb_btn]),
+            ft.Text(
+                "※ ContentBuilderフォルダはbuilder/builder_osx/builder_linuxを含むフォルダです",
+                size=11,
+                color=ft.Colors.GREY
             ),
+            test_help_btn,
             
-            ft.Container(
-                content=ft.Column([
-                    ft.Text("ビルド出力設定", size=16, weight=ft.FontWeight.BOLD),
-                    ft.Row([build_output_field, select_output_btn, reset_output_btn]),
-                    ft.Text(
-                        "※ 設定すると、ビルドログがこのフォルダに保存されます",
-                        size=11,
-                        color=ft.Colors.GREY
-                    ),
-                ]),
-                padding=ft.padding.only(bottom=20)
+            ft.Text("ビルド出力設定", size=16, weight=ft.FontWeight.BOLD),
+            ft.Row([build_output_field, select_output_btn, reset_output_btn]),
+            ft.Text(
+                "※ 設定すると、ビルドログがこのフォルダに保存されます",
+                size=11,
+                color=ft.Colors.GREY
             ),
-            
-        ], width=500, scroll=ft.ScrollMode.AUTO)
+        ], spacing=20, width=500, scroll=ft.ScrollMode.AUTO)
         
         dlg = ft.AlertDialog(
             modal=True,
             title=ft.Text("基本設定"),
-            content=content,
-            actions=[
-                ft.TextButton("キャンセル", on_click=lambda e: DialogBuilder._close_dialog(self.page, dlg)),
-                ft.TextButton("保存", on_click=save_settings),
-            ]
+            content=content
         )
+        dlg.actions = [
+            ft.TextButton("キャンセル", on_click=DialogBuilder.close_handler(self.page, dlg)),
+            ft.TextButton("保存", on_click=save_settings),
+        ]
         
-        self.page.overlay.append(dlg)
-        dlg.open = True
-        self.page.update()
+        self._settings_dlg = dlg
+        self._cb_field = content_builder_field
+        self._out_field = build_output_field
     
     def _validate_content_builder_path(self, path: str) -> bool:
         """ContentBuilderパスの妥当性を検証"""
-        if not os.path.exists(path):
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
             return False
         
         # プラットフォーム別のbuilderフォルダをチェック
-        valid_folders = ["builder", "builder_osx", "builder_linux"]
-        
-        for folder in valid_folders:
-            if os.path.exists(os.path.join(path, folder)):
-                return True
-        
-        return False
+        return _has_builder_folder(path, mtime)
     
     def select_build_output_folder(self):
         """ビルド出力フォルダを選択"""
@@ -237,10 +283,10 @@ class SystemSettingsManager:
                 self.helper.save_settings()
                 self.build_output_path_text.value = folder_path
                 self.page.update()
-                self._log_message(f"ビルド出力フォルダを設定: {folder_path}")
+                self._log.info(f"ビルド出力フォルダを設定: {folder_path}")
 
-        # Run in separate thread to avoid blocking UI
-        threading.Thread(target=run_picker, daemon=True).start()
+        # Run in the picker worker to avoid blocking UI
+        self._submit_picker(run_picker)
     
     def reset_build_output_folder(self):
         """ビルド出力フォルダをリセット"""
@@ -248,10 +294,4 @@ class SystemSettingsManager:
         self.helper.save_settings()
         self.build_output_path_text.value = "未設定"
         self.page.update()
-        self._log_message("ビルド出力フォルダをリセットしました")
-    
-    def _log_message(self, message: str):
-        """ログメッセージ出力"""
-        import time
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
\ No newline at end of file
+        self._log.info("ビルド出力フォルダをリセットしました")
@@ -1,41 +1,61 @@
 """UI Helper functions for Morn Steam Upload Helper"""
 
 import flet as ft
+import functools
 from pathlib import Path
-import webbrowser
+import time
+import weakref
+
+from platform_helpers import PlatformUtilities, _webbrowser
+
+
+def _has_app_id(app_id) -> bool:
+    """App IDが入力されているか"""
+    return bool(app_id and app_id.strip())
 
 
 class DialogBuilder:
     """共通ダイアログ作成クラス"""
     
+    _pickers_by_page = weakref.WeakKeyDictionary()  # ページごとに使い回すFilePicker
+    
     @staticmethod
     def create_text_field(label: str, **kwargs):
         """共通テキストフィールドを作成"""
         return ft.TextField(label=label, **kwargs)
     
     @staticmethod
-    def create_steam_page_buttons(app_id_field, enabled_callback=None):
+    def create_steam_page_buttons(app_id_field):
         """Steamページボタンのペアを作成"""
+        # 現在の有効状態（編集時は既存の値から初期化）
+        state = {'valid': _has_app_id(app_id_field.value)}
+        
+        def open_builds(e):
+            SteamPageOpener.open_page("builds", app_id_field.value)
+        
+        def open_depots(e):
+            SteamPageOpener.open_page("depots", app_id_field.value)
+        
         build_btn = ft.ElevatedButton(
             "ビルドページを開く",
-            disabled=True,
-            on_click=lambda e: SteamPageOpener.open_page("builds", app_id_field.value) if app_id_field.value else None
+            disabled=not state['valid'],
+            on_click=open_builds
         )
         
         depot_btn = ft.ElevatedButton(
             "デポページを開く", 
-            disabled=True,
-            on_click=lambda e: SteamPageOpener.open_page("depots", app_id_field.value) if app_id_field.value else None
+            disabled=not state['valid'],
+            on_click=open_depots
         )
         
-        # app_idフィールドの値に応じてボタンを有効/無効にする
+        # app_idフィールドの値に応じてボタンを有効/無効にする（状態が変わった時だけ更新）
         def update_buttons(e):
-            enabled = bool(e.control.value and e.control.value.strip())
-            build_btn.disabled = not enabled
-            depot_btn.disabled = not enabled
-            # ボタンの更新を通知
-            if hasattr(e.page, 'update'):
-                e.page.update()
+            valid = _has_app_id(e.control.value)
+            if valid == state['valid']:
+                return
+            state['valid'] = valid
+            build_btn.disabled = depot_btn.disabled = not valid
+            e.page.update()
         
         app_id_field.on_change = update_buttons
         
@@ -56,9 +76,8 @@ class DialogBuilder:
                     if on_selection_callback:
                         on_selection_callback()
             
-            folder_picker = ft.FilePicker(on_result=on_folder_selected)
-            e.page.overlay.append(folder_picker)
-            e.page.update()
+            folder_picker = DialogBuilder._get_folder_picker(e.page)
+            folder_picker.on_result = on_folder_selected
             folder_picker.get_directory_path(dialog_title="コンテンツフォルダを選択")
         
         return ft.IconButton(
@@ -68,34 +87,82 @@ class DialogBuilder:
         )
     
     @staticmethod
-    def show_error_dialog(page: ft.Page, message: str):
-        """エラーダイアログを表示"""
+    def _get_folder_picker(page: ft.Page) -> ft.FilePicker:
+        """ページ共通のFilePickerを取得（初回のみoverlayに追加）"""
+        folder_picker = DialogBuilder._pickers_by_page.get(page)
+        if folder_picker is None:
+            folder_picker = ft.FilePicker()
+            page.overlay.append(folder_picker)
+            page.update()
+            DialogBuilder._pickers_by_page[page] = folder_picker
+        return folder_picker
+    
+    @staticmethod
+    def _build_message_dialog(page: ft.Page, title: str, message: str) -> ft.AlertDialog:
+        """OKボタンだけのメッセージダイアログを作成"""
         dlg = ft.AlertDialog(
             modal=True,
-            title=ft.Text("エラー"),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("OK", on_click=lambda e: DialogBuilder._close_dialog(page, dlg))
-            ]
+            title=ft.Text(title),
+            content=ft.Text(message)
         )
-        page.overlay.append(dlg)
-        dlg.open = True
-        page.update()
+        dlg.actions = [ft.TextButton("OK", on_click=DialogBuilder.close_handler(page, dlg))]
+        return dlg
+    
+    @staticmethod
+    def build_error_dialog(page: ft.Page, message: str) -> ft.AlertDialog:
+        """エラーダイアログを作成"""
+        return DialogBuilder._build_message_dialog(page, "エラー", message)
+    
+    @staticmethod
+    def build_success_dialog(page: ft.Page, message: str) -> ft.AlertDialog:
+        """成功ダイアログを作成"""
+        return DialogBuilder._build_message_dialog(page, "成功", message)
+    
+    @staticmethod
+    def build_info_dialog(page: ft.Page, message: str) -> ft.AlertDialog:
+        """お知らせダイアログを作成"""
+        return DialogBuilder._build_message_dialog(page, "お知らせ", message)
+    
+    @staticmethod
+    def show_error_dialog(page: ft.Page, message: str):
+        """エラーダイアログを表示"""
+        DialogBuilder.open_dialog(page, DialogBuilder.build_error_dialog(page, message))
     
     @staticmethod
     def show_success_dialog(page: ft.Page, message: str):
         """成功ダイアログを表示"""
-        dlg = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("成功"),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("OK", on_click=lambda e: DialogBuilder._close_dialog(page, dlg))
-            ]
-        )
-        page.overlay.append(dlg)
+        DialogBuilder.open_dialog(page, DialogBuilder.build_success_dialog(page, message))
+    
+    @staticmethod
+    def show_info_dialog(page: ft.Page, message: str):
+        """お知らせダイアログを表示"""
+        DialogBuilder.open_dialog(page, DialogBuilder.build_info_dialog(page, message))
+    
+    @staticmethod
+    def open_dialog(page: ft.Page, dlg: ft.AlertDialog, update: bool = True):
+        """ダイアログをoverlayに追加して開く（update=Falseなら呼び出し側でまとめて更新）"""
+        # 使い回すダイアログは登録済みなので重複して追加しない
+        if dlg not in page.overlay:
+            page.overlay.append(dlg)
         dlg.open = True
-        page.update()
+        if update:
+            page.update()
+    
+    @staticmethod
+    def replace_dialog(page: ft.Page, old_dlg: ft.AlertDialog, new_dlg: ft.AlertDialog):
+        """開いているダイアログを閉じて別のダイアログを開く（ページ更新は1回）"""
+        old_dlg.open = False
+        DialogBuilder.open_dialog(page, new_dlg)
+    
+    @classmethod
+    def close_handler(cls, page: ft.Page, dlg: ft.AlertDialog):
+        """ダイアログを閉じるon_clickハンドラを作成"""
+        return functools.partial(cls._close_fn, page, dlg)
+    
+    @staticmethod
+    def _close_fn(page: ft.Page, dlg: ft.AlertDialog, e):
+        """on_clickイベントからダイアログを閉じる"""
+        DialogBuilder._close_dialog(page, dlg)
     
     @staticmethod
     def _close_dialog(page: ft.Page, dlg: ft.AlertDialog):
@@ -107,40 +174,24 @@ class DialogBuilder:
 class SteamPageOpener:
     """Steamページを開くための共通処理"""
     
+    _URL_TEMPLATE = "https://partner.steamgames.com/apps/{}/{}"
+    _DEDUPE_SECONDS = 0.5  # 同じページを続けて開かない間隔
+    _last = {'key': None, 'ts': 0.0}
+    
     @staticmethod
     def open_page(page_type: str, app_id: str):
-        """Steamページを開く"""
+        """Steamページを開く（ダブルクリックなどの連続呼び出しは無視）"""
         if app_id:
-            url = f"https://partner.steamgames.com/apps/{page_type}/{app_id}"
-            webbrowser.open(url)
-            print(f"Steam {page_type} ページを開きました: {url}")
-
-
-class ButtonStateManager:
-    """ボタンの有効/無効状態を管理"""
-    
-    def __init__(self, page: ft.Page):
-        self.page = page
-        self.buttons = {}
-    
-    def register_button(self, name: str, button: ft.ElevatedButton, 
-                       enabled_condition=None):
-        """ボタンを登録"""
-        self.buttons[name] = {
-            'button': button,
-            'condition': enabled_condition
-        }
-    
-    def update_states(self, **context):
-        """すべてのボタンの状態を更新"""
-        for name, info in self.buttons.items():
-            button = info['button']
-            condition = info['condition']
-            
-            if condition:
-                button.disabled = not condition(**context)
+            key = (page_type, app_id)
+            now = time.monotonic()
+            last = SteamPageOpener._last
+            if key == last['key'] and now - last['ts'] < SteamPageOpener._DEDUPE_SECONDS:
+                return
+            last.update(key=key, ts=now)
             
-        self.page.update()
+            url = SteamPageOpener._URL_TEMPLATE.format(page_type, app_id)
+            _webbrowser().open(url)
+            print(f"Steam {page_type} ページを開きました: {url}")
 
 
 class ConfigDialogBuilder:
@@ -214,8 +265,9 @@ class ConfigDialogBuilder:
             ft.Row([fields['content_path'], folder_picker_btn])
         ])
         
-        return ft.Container(
-            content=ft.Column(controls, tight=True),
+        return ft.Column(
+            controls,
+            tight=True,
             width=400,
             height=450 if 'name' not in fields or fields['name'].read_only else 500
         )
@@ -227,18 +279,4 @@ class PlatformCommands:
     @staticmethod
     def open_folder(path: str):
         """フォルダを開く（プラットフォーム対応）"""
-        import platform
-        import subprocess
-        import os
-        
-        if not path or not os.path.exists(path):
-            return False
-            
-        if platform.system() == "Darwin":  # macOS
-            subprocess.run(["open", path])
-        elif platform.system() == "Windows":
-            subprocess.run(["explorer", path])
-        else:  # Linux
-            subprocess.run(["xdg-open", path])
-        
-        return True
\ No newline at end of file
+        return PlatformUtilities.open_folder(path)
\ No newline at end of file
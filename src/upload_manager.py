@@ -1,17 +1,142 @@
 """Upload management functionality for Steam Upload Helper"""
 
 import flet as ft
+import functools
+import logging
 import os
+import re
 import time
-import webbrowser
-import platform
-import subprocess
 import threading
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-from ui_helpers import DialogBuilder, PlatformCommands
+from ui_helpers import DialogBuilder
 from command_sender import CommandSender
-from platform_helpers import ConsoleMonitor
+from platform_helpers import ConsoleMonitor, LogTailer, PlatformUtilities, SteamCMDLauncher, _SYSTEM, _webbrowser
+
+# このプラットフォームで使うアップロード/ダウンロード実行メソッド（未対応の環境は手動実行）
+_UPLOAD_EXECUTOR = {
+    "Windows": "_execute_upload_windows",
+    "Darwin": "_execute_upload_macos",
+}.get(_SYSTEM, "_execute_upload_manual")
+_DOWNLOAD_EXECUTOR = {
+    "Windows": "_execute_download_windows",
+    "Darwin": "_execute_download_macos",
+}.get(_SYSTEM, "_execute_download_manual")
+
+
+def _button_style(bgcolor: str) -> ft.ButtonStyle:
+    """白文字・無効時グレーのボタンスタイルを作成"""
+    return ft.ButtonStyle(
+        color={
+            ft.ControlState.DEFAULT: ft.Colors.WHITE,
+            ft.ControlState.DISABLED: ft.Colors.GREY_400,
+        },
+        bgcolor={
+            ft.ControlState.DEFAULT: bgcolor,
+            ft.ControlState.DISABLED: ft.Colors.GREY_300,
+        },
+    )
+
+
+# ボタンのスタイル（全インスタンスで共通）
+_UPLOAD_BTN_STYLE = _button_style(ft.Colors.BLUE)
+_BUILDS_BTN_STYLE = _button_style(ft.Colors.PURPLE)
+_DOWNLOAD_BTN_STYLE = _button_style(ft.Colors.GREEN)
+_FOLDER_BTN_STYLE = _button_style(ft.Colors.ORANGE)
+
+# コマンドを送るSteamCMDコンソールを見分けるプロンプト
+_STEAM_PROMPT = "Steam>"
+
+# SteamCMDの出力から完了・エラーを検出するパターン
+_UPLOAD_DONE_PATTERN = "Successfully finished AppID"
+_DOWNLOAD_DONE_PATTERN = "Depot download complete"
+_DOWNLOAD_ERROR_PATTERNS = [
+    "Depot download failed",
+    "Invalid default manifest",
+    "missing app info",
+    "Missing configuration"
+]
+
+# ログの追記分を1回の走査で判定するためのコンパイル済みパターン
+_UPLOAD_DONE_RE = re.compile(re.escape(_UPLOAD_DONE_PATTERN.encode()))
+_DOWNLOAD_DONE_RE = re.compile(re.escape(_DOWNLOAD_DONE_PATTERN.encode()))
+_DOWNLOAD_ERROR_RE = re.compile(b"|".join(re.escape(p.encode()) for p in _DOWNLOAD_ERROR_PATTERNS))
+
+# ダウンロードフォルダの存在確認結果を使い回す時間（秒）
+_EXISTS_CACHE_TTL = 2.0
+
+# ダウンロードフィールドの連続入力をまとめる待ち時間（秒）
+_FIELD_CHANGE_DEBOUNCE = 0.15
+
+# 監視中に経過時間をログ出力する間隔（秒）
+_PROGRESS_LOG_INTERVAL = 10.0
+
+# ステータス表示のテンプレート（先頭に✅/❌が入る）
+_LOGIN_STATUS_TMPL = "{} コンソールを開いてログインしている"
+_CONFIG_STATUS_TMPL = "{} アップロード設定を選択している"
+
+
+class _LogActivityGate:
+    """ログファイルが更新された時だけ内容を確認し、更新が無い間は確認間隔を広げる"""
+    
+    MIN_INTERVAL = 0.25  # 更新直後の確認間隔（秒）
+    MAX_INTERVAL = 5.0  # 更新が無い場合の最大確認間隔（秒）
+    DEFAULT_INTERVAL = 1.0  # ログファイルを参照できない環境（macOS）の最初の確認間隔（秒）
+    MAX_BLIND_INTERVAL = 10.0  # ログファイルを参照できない環境の最大確認間隔（秒）
+    
+    def __init__(self, steamcmd_path: str):
+        self.steamcmd_path = steamcmd_path
+        self.log_path = None
+        self.interval = self.DEFAULT_INTERVAL
+        self._signature = None
+    
+    def poll(self) -> bool:
+        """前回から変化があったか（内容を確認すべきか）を返し、次の待機間隔を決める"""
+        if self.log_path is None:
+            self.log_path = ConsoleMonitor.find_log_path(self.steamcmd_path)
+            if self.log_path is None:
+                # 更新の有無が分からないので毎回確認するが、確認（osascript）の間隔は徐々に広げる
+                self.interval = min(self.interval * 1.5, self.MAX_BLIND_INTERVAL)
+                return True
+        
+        try:
+            st = os.stat(self.log_path)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        
+        changed = signature != self._signature
+        self._signature = signature
+        if changed:
+            self.interval = self.MIN_INTERVAL
+        else:
+            self.interval = min(self.interval * 1.5, self.MAX_INTERVAL)
+        return changed
+
+
+@functools.lru_cache(maxsize=32)
+def _format_vdf_arg(vdf_path: str) -> str:
+    """VDFファイルのパスをrun_app_buildの引数形式にする（絶対パス化し、スペースがあれば引用符で囲む）"""
+    if not os.path.isabs(vdf_path):
+        vdf_path = os.path.abspath(vdf_path)
+    if " " in vdf_path:
+        return f'"{vdf_path}"'
+    return vdf_path
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_download_path(steamcmd_path: str, content_builder_path: str, app_id: str) -> str:
+    """SteamCMDのデフォルトダウンロードパスを構築（設定値とApp IDの組ごとにキャッシュ）"""
+    if not steamcmd_path and content_builder_path:
+        # steamcmd_pathが保存されていない場合はcontent_builder_pathから取得
+        steamcmd_path = SteamCMDLauncher.get_steamcmd_path(content_builder_path)
+    
+    if steamcmd_path:
+        steamcmd_dir = os.path.dirname(steamcmd_path)
+        return os.path.join(steamcmd_dir, "steamapps", "content", f"app_{app_id}")
+    # フォールバックとして現在のディレクトリを使用
+    return os.path.join(os.getcwd(), "steamapps", "content", f"app_{app_id}")
 
 
 class UploadManager:
@@ -20,6 +145,7 @@ class UploadManager:
     def __init__(self, helper, page: ft.Page):
         self.helper = helper
         self.page = page
+        self._log = logging.getLogger("msuh.upload")
         self.upload_in_progress = False
         self.download_in_progress = False
         
@@ -44,33 +170,58 @@ class UploadManager:
         
         # コールバック
         self.on_upload_complete = None
+        
+        # (設定名, VDFパス)ごとに構築済みのアップロードコマンド
+        self._cmd_cache = {}
+        
+        # 前回反映した (ログイン状態, 設定選択状態)
+        self._last_state = (None, None)
+        
+        # 進行中ダイアログ（create_ui_componentsで作成）
+        self._upload_progress_dialog = None
+        self._download_progress_dialog = None
+        
+        # 手動実行コマンドのダイアログとコマンド表示Text（create_ui_componentsで作成）
+        self._upload_command_dialog = None
+        self._upload_command_text = None
+        self._download_command_dialog = None
+        self._download_command_text = None
+        
+        # ダウンロードフォルダの存在確認結果 {パス: (確認時刻, 存在するか)}
+        self._path_exists_cache = {}
+        
+        # ダウンロードフィールドの入力反映を遅らせるタイマー
+        self._field_change_timer = None
+        self._field_change_lock = threading.Lock()
+        
+        # _ui_batchの入れ子の深さと変更の有無（スレッドごと。監視スレッドからの更新は即時反映）
+        self._batch_state = threading.local()
+        
+        # ページ終了時に監視ループを抜けるためのフラグ
+        self._closing = threading.Event()
+        
+        # 監視処理用のワーカー（1回の実行につき1本。送信が終わると次の実行を始められるため、
+        # 複数の実行が重なっても後の監視が待たされないよう余裕を持たせる）
+        # インスタンスごとに持ち、close()で停止する
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="steam-monitor")
     
     def create_ui_components(self):
         """アップロード関連のUIコンポーネントを作成"""
         self.upload_button = ft.ElevatedButton(
             "Steamにアップロード",
-            on_click=lambda e: self.run_upload(),
+            on_click=self.run_upload,
             icon=ft.Icons.UPLOAD,
-            style=ft.ButtonStyle(
-                color={
-                    ft.ControlState.DEFAULT: ft.Colors.WHITE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_400,
-                },
-                bgcolor={
-                    ft.ControlState.DEFAULT: ft.Colors.BLUE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_300,
-                },
-            ),
+            style=_UPLOAD_BTN_STYLE,
             disabled=True
         )
         
         self.login_status_text = ft.Text(
-            "❌ コンソールを開いてログインしている",
+            _LOGIN_STATUS_TMPL.format("❌"),
             size=14
         )
         
         self.config_status_text = ft.Text(
-            "❌ アップロード設定を選択している",
+            _CONFIG_STATUS_TMPL.format("❌"),
             size=14
         )
         
@@ -80,97 +231,113 @@ class UploadManager:
         self.download_app_id_field = ft.TextField(
             label="App ID *",
             width=200,
-            on_change=lambda e: self._on_download_field_change()
+            on_change=self._on_download_field_change
         )
         
         self.download_depot_id_field = ft.TextField(
             label="Depot ID *",
             width=200,
-            on_change=lambda e: self._on_download_field_change()
+            on_change=self._on_download_field_change
         )
         
         self.download_manifest_gid_field = ft.TextField(
             label="Manifest GID *",
             width=250,
-            on_change=lambda e: self._on_download_field_change()
+            on_change=self._on_download_field_change
         )
         
         self.open_builds_page_button = ft.ElevatedButton(
             "ビルドページを開く",
             icon=ft.Icons.OPEN_IN_NEW,
-            on_click=lambda e: self._open_builds_page(),
+            on_click=self._open_builds_page,
             disabled=True,
-            style=ft.ButtonStyle(
-                color={
-                    ft.ControlState.DEFAULT: ft.Colors.WHITE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_400,
-                },
-                bgcolor={
-                    ft.ControlState.DEFAULT: ft.Colors.PURPLE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_300,
-                },
-            ),
+            style=_BUILDS_BTN_STYLE,
         )
         
         self.download_start_button = ft.ElevatedButton(
             "ダウンロード開始",
             icon=ft.Icons.DOWNLOAD,
-            on_click=lambda e: self.run_download_with_manifest(),
-            style=ft.ButtonStyle(
-                color={
-                    ft.ControlState.DEFAULT: ft.Colors.WHITE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_400,
-                },
-                bgcolor={
-                    ft.ControlState.DEFAULT: ft.Colors.GREEN,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_300,
-                },
-            ),
+            on_click=self.run_download_with_manifest,
+            style=_DOWNLOAD_BTN_STYLE,
             disabled=True
         )
         
         self.open_download_folder_button = ft.ElevatedButton(
             "フォルダを開く",
             icon=ft.Icons.FOLDER_OPEN,
-            on_click=lambda e: self.open_download_folder_from_input(),
-            style=ft.ButtonStyle(
-                color={
-                    ft.ControlState.DEFAULT: ft.Colors.WHITE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_400,
-                },
-                bgcolor={
-                    ft.ControlState.DEFAULT: ft.Colors.ORANGE,
-                    ft.ControlState.DISABLED: ft.Colors.GREY_300,
-                },
-            ),
+            on_click=self.open_download_folder_from_input,
+            style=_FOLDER_BTN_STYLE,
             disabled=True
         )
         
         self.download_login_status_text = ft.Text(
-            "❌ コンソールを開いてログインしている",
+            _LOGIN_STATUS_TMPL.format("❌"),
             size=14
         )
+        
+        # 実行中に使うダイアログは1度だけ作成してoverlayに登録し、開閉だけ切り替える
+        self._upload_progress_dialog = self._build_progress_dialog(
+            "アップロード中", "Steamへアップロード中です...", "アップロードが完了するまでお待ちください")
+        self._download_progress_dialog = self._build_progress_dialog(
+            "ダウンロード中", "Steamからダウンロード中です...", "ダウンロードが完了するまでお待ちください")
+        self._upload_command_dialog, self._upload_command_text = self._build_command_dialog("アップロードコマンド")
+        self._download_command_dialog, self._download_command_text = self._build_command_dialog("ダウンロードコマンド")
+        self.page.overlay.extend([
+            self._upload_progress_dialog,
+            self._download_progress_dialog,
+            self._upload_command_dialog,
+            self._download_command_dialog,
+        ])
+    
+    @contextmanager
+    def _ui_batch(self):
+        """ブロック内のUI変更を終了時の1回のpage.update()にまとめる（入れ子の場合は一番外側で、変更があった時だけ更新）"""
+        state = self._batch_state
+        depth = getattr(state, 'depth', 0)
+        state.depth = depth + 1
+        if depth == 0:
+            state.dirty = False
+        try:
+            yield
+        finally:
+            state.depth = depth
+            if depth == 0 and state.dirty:
+                state.dirty = False
+                self.page.update()
+    
+    def _mark_dirty(self):
+        """UIの変更を反映（バッチ中なら変更ありとして終了時の更新に任せる）"""
+        state = self._batch_state
+        if getattr(state, 'depth', 0):
+            state.dirty = True
+        else:
+            self.page.update()
     
     def update_upload_button_state(self, is_logged_in: bool, has_config: bool):
-        """アップロードボタンの状態を更新"""
-        # ステータスアイコンを更新
-        self.login_status_text.value = f"{'✅' if is_logged_in else '❌'} コンソールを開いてログインしている"
-        self.config_status_text.value = f"{'✅' if has_config else '❌'} アップロード設定を選択している"
-        # ダウンロード用のステータスも更新
-        self.download_login_status_text.value = f"{'✅' if is_logged_in else '❌'} コンソールを開いてログインしている"
-        
-        # 両方の条件が満たされた時のみアップロードボタンを有効化
-        self.upload_button.disabled = not (is_logged_in and has_config)
-        
-        # ダウンロードボタンの状態を更新
-        self._update_download_button_states(is_logged_in)
-        
-        self.page.update()
+        """アップロードボタンの状態を更新（状態が変わっていなければ何もしない）"""
+        if (is_logged_in, has_config) == self._last_state:
+            return
+        self._last_state = (is_logged_in, has_config)
+        
+        with self._ui_batch():
+            # ステータスアイコンを更新
+            login_status = _LOGIN_STATUS_TMPL.format('✅' if is_logged_in else '❌')
+            self.login_status_text.value = login_status
+            self.config_status_text.value = _CONFIG_STATUS_TMPL.format('✅' if has_config else '❌')
+            # ダウンロード用のステータスも更新
+            self.download_login_status_text.value = login_status
+            
+            # 両方の条件が満たされた時のみアップロードボタンを有効化
+            self.upload_button.disabled = not (is_logged_in and has_config)
+            
+            # ダウンロードボタンの状態を更新
+            self._update_download_button_states(is_logged_in)
+            self._mark_dirty()
     
-    def run_upload(self):
+    def run_upload(self, e=None):
         """アップロード処理を実行"""
         if self.upload_in_progress:
-            self._log_message("アップロード処理中...")
+            self._log.info("アップロード処理中...")
             return
         
         if not self.helper.is_logged_in:
@@ -194,29 +361,38 @@ class UploadManager:
             )
             return
         
-        self.upload_in_progress = True
-        self.upload_button.disabled = True
-        self.progress_bar.visible = True
-        self.page.update()
-        
-        try:
-            self._log_message(f"アップロード開始: {config_name}")
-            self._log_message(f"App ID: {config.get('app_id')}")
-            self._log_message(f"Depot ID: {config.get('depot_id')}")
-            self._log_message(f"ブランチ: {config.get('branch', 'なし')}")
-            self._log_message(f"コンテンツパス: {content_path}")
+        # 開始から終了までのUI変更を1回の更新にまとめる（進行中ダイアログの表示時だけ途中で更新）
+        with self._ui_batch():
+            self.upload_in_progress = True
+            self.upload_button.disabled = True
+            self.progress_bar.visible = True
+            self._mark_dirty()
             
-            # VDFファイル生成とアップロード実行
-            self._execute_upload(config_name, config, content_path)
+            try:
+                self._log.info(
+                    f"アップロード開始: {config_name}\n"
+                    f"App ID: {config.get('app_id')}\n"
+                    f"Depot ID: {config.get('depot_id')}\n"
+                    f"ブランチ: {config.get('branch', 'なし')}\n"
+                    f"コンテンツパス: {content_path}"
+                )
+                
+                # VDFファイル生成とアップロード実行
+                self._execute_upload(config_name, config, content_path)
             
-        except Exception as ex:
-            self._log_message(f"アップロード中にエラー: {str(ex)}")
-            DialogBuilder.show_error_dialog(self.page, f"アップロードエラー: {str(ex)}")
-        finally:
-            self.upload_button.disabled = False
-            self.upload_in_progress = False
-            self.progress_bar.visible = False
-            self.page.update()
+            except Exception as ex:
+                self._log.info(f"アップロード中にエラー: {str(ex)}")
+                # ページ更新はバッチの終了時にまとめて行う
+                DialogBuilder.open_dialog(
+                    self.page,
+                    DialogBuilder.build_error_dialog(self.page, f"アップロードエラー: {str(ex)}"),
+                    update=False
+                )
+            finally:
+                self.upload_button.disabled = False
+                self.upload_in_progress = False
+                self.progress_bar.visible = False
+                self._mark_dirty()
     
     def _execute_upload(self, config_name: str, config: dict, content_path: str):
         """実際のアップロード処理を実行"""
@@ -224,363 +400,370 @@ class UploadManager:
         vdf_path = self.helper.create_vdf_file(config_name, config)
         
         if not vdf_path:
-            self._log_message("VDFファイルの生成に失敗しました")
+            self._log.info("VDFファイルの生成に失敗しました")
             return
         
-        self._log_message(f"VDFファイルを生成: {vdf_path}")
+        # アップロードコマンドを構築（同じ設定・VDFなら前回のものを再利用）
+        cache_key = (config_name, vdf_path)
+        upload_command = self._cmd_cache.get(cache_key)
+        if upload_command is None:
+            upload_command = self._build_upload_command(vdf_path)
+            self._cmd_cache[cache_key] = upload_command
         
-        # アップロードコマンドを構築
-        upload_command = self._build_upload_command(vdf_path)
-        
-        self._log_message(f"実行コマンド: {upload_command}")
+        self._log.info(
+            f"VDFファイルを生成: {vdf_path}\n"
+            f"実行コマンド: {upload_command}"
+        )
         
         # アップロード進行中ダイアログを表示
         self._show_upload_progress_dialog()
         
-        # プラットフォーム別の実行（この分岐は必要なので残す）
-        if platform.system() == "Windows":
-            self._execute_upload_windows(upload_command)
-        else:
-            self._execute_upload_unix(upload_command)
+        # プラットフォーム別の実行
+        getattr(self, _UPLOAD_EXECUTOR)(upload_command)
     
     def _build_upload_command(self, vdf_path: str) -> str:
         """アップロードコマンドを構築"""
-        # VDFファイルの絶対パスを取得
-        abs_vdf_path = os.path.abspath(vdf_path)
-        
-        # パスにスペースがある場合は引用符で囲む
-        if " " in abs_vdf_path:
-            abs_vdf_path = f'"{abs_vdf_path}"'
-        
         # SteamCMD内での正しいコマンド形式（+は起動時オプションなので、コンソール内では使わない）
-        return f"run_app_build {abs_vdf_path}"
+        return f"run_app_build {_format_vdf_arg(vdf_path)}"
     
     def _execute_upload_windows(self, upload_command: str):
         """Windows環境でのアップロード実行"""
-        self._log_message("自動コマンド送信を試行中...")
+        self._log.info("自動コマンド送信を試行中...")
+        
+        # 送信直後の出力も拾えるよう、送信前にログの読み取り位置を決めておく
+        tailer = self._create_tailer()
         
         # 共通のCommandSenderを使用
         success = CommandSender.send_command(
             upload_command, 
-            "Steam>",
+            _STEAM_PROMPT,
             process_id=getattr(self.helper, 'steamcmd_cmd_process_id', None),
-            log_callback=self._log_message
+            log_callback=self._log.info
         )
         
         if success:
-            self._log_message("✓ アップロードコマンドを自動実行しました")
-            self._log_message("アップロードが完了するまでお待ちください...")
+            self._log.info("✓ アップロードコマンドを自動実行しました")
+            self._log.info("アップロードが完了するまでお待ちください...")
             # アップロード完了を監視
-            self._monitor_upload_completion()
+            self._monitor_upload_completion(tailer)
         else:
-            self._log_message("自動送信に失敗しました。")
-            # 進行中ダイアログを閉じる
-            self._close_upload_progress_dialog()
-            # 失敗時は手動でダイアログを表示（フォールバック）
+            self._log.info("自動送信に失敗しました。")
+            # 失敗時は進行中ダイアログを手動実行ダイアログに切り替える（フォールバック）
             self._show_manual_command_dialog(upload_command)
     
-    def _execute_upload_unix(self, upload_command: str):
-        """Unix系環境でのアップロード実行"""
-        # この分岐もプラットフォーム固有の処理が異なるため必要
-        if platform.system() == "Darwin":
-            self._execute_upload_macos(upload_command)
-        else:
-            # Linuxでは手動実行を促す
-            # 進行中ダイアログを閉じる
-            self._close_upload_progress_dialog()
-            self._show_manual_command_dialog(upload_command)
+    def _execute_upload_manual(self, upload_command: str):
+        """自動送信に未対応の環境（Linux）でのアップロード実行"""
+        # 進行中ダイアログを閉じて手動実行を促す
+        self._show_manual_command_dialog(upload_command)
     
     def _execute_upload_macos(self, upload_command: str):
         """macOS環境でのアップロード実行"""
-        self._log_message("自動コマンド送信を試行中...")
+        self._log.info("自動コマンド送信を試行中...")
+        
+        # 送信直後の出力も拾えるよう、送信前にログの読み取り位置を決めておく
+        tailer = self._create_tailer()
         
         # 共通のCommandSenderを使用 - Steam>を含むウィンドウを自動で探す
         success = CommandSender.send_command(
             upload_command,
-            "Steam>",
-            log_callback=self._log_message
+            _STEAM_PROMPT,
+            log_callback=self._log.info
         )
         
         if success:
-            self._log_message("✓ アップロードコマンドを自動実行しました")
-            self._log_message("アップロードが完了するまでお待ちください...")
+            self._log.info("✓ アップロードコマンドを自動実行しました")
+            self._log.info("アップロードが完了するまでお待ちください...")
             # アップロード完了を監視
-            self._monitor_upload_completion()
+            self._monitor_upload_completion(tailer)
         else:
-            self._log_message("自動送信に失敗しました。")
-            # 進行中ダイアログを閉じる
-            self._close_upload_progress_dialog()
-            # 失敗時は手動でダイアログを表示（フォールバック）
+            self._log.info("自動送信に失敗しました。")
+            # 失敗時は進行中ダイアログを手動実行ダイアログに切り替える（フォールバック）
             self._show_manual_command_dialog(upload_command)
     
-    def _show_manual_command_dialog(self, upload_command: str):
-        """手動でコマンドを実行するためのダイアログを表示"""
-        # クリップボードにコピー
-        self.page.set_clipboard(upload_command)
-        
+    def _build_command_dialog(self, title: str):
+        """SteamCMDで手動実行するコマンドのダイアログを作成（ダイアログとコマンド表示用Textを返す）"""
+        command_text = ft.Text(selectable=True)
         dlg = ft.AlertDialog(
             modal=True,
-            title=ft.Text("アップロードコマンド"),
+            title=ft.Text(title),
             content=ft.Column([
                 ft.Text("以下のコマンドをSteamCMDコンソールで実行してください："),
                 ft.Container(
-                    content=ft.Text(upload_command, selectable=True),
+                    content=command_text,
                     bgcolor=ft.Colors.GREY_900,
                     padding=10,
                     border_radius=5
                 ),
                 ft.Text("(コマンドはクリップボードにコピーされました)", 
                        size=12, color=ft.Colors.GREY)
-            ], width=400),
-            actions=[
-                ft.TextButton("OK", on_click=lambda e: DialogBuilder._close_dialog(self.page, dlg))
-            ]
+            ], width=400)
         )
+        dlg.actions = [ft.TextButton("OK", on_click=DialogBuilder.close_handler(self.page, dlg))]
+        return dlg, command_text
+    
+    def _show_manual_command_dialog(self, upload_command: str):
+        """手動でコマンドを実行するためのダイアログを表示（進行中ダイアログと同じ更新で切り替え）"""
+        self._upload_command_text.value = upload_command
+        self._close_upload_progress_dialog(self._upload_command_dialog)
+        # クリップボードにコピー
+        self.page.set_clipboard(upload_command)
         
-        self.page.overlay.append(dlg)
-        dlg.open = True
-        self.page.update()
-        
-        self._log_message(f"Please run in SteamCMD console: {upload_command}")
+        self._log.info(f"Please run in SteamCMD console: {upload_command}")
     
-    def _show_upload_progress_dialog(self):
-        """アップロード進行中ダイアログを表示"""
-        self._upload_progress_dialog = ft.AlertDialog(
+    def _build_progress_dialog(self, title: str, message: str, wait_message: str) -> ft.AlertDialog:
+        """進行中ダイアログを作成（create_ui_componentsで1度だけ呼ぶ）"""
+        return ft.AlertDialog(
             modal=True,
-            title=ft.Text("アップロード中"),
+            title=ft.Text(title),
             content=ft.Column([
                 ft.ProgressRing(width=40, height=40, stroke_width=3),
-                ft.Text("Steamへアップロード中です...", size=14),
+                ft.Text(message, size=14),
                 ft.Container(height=10),
-                ft.Text("アップロードが完了するまでお待ちください", 
+                ft.Text(wait_message, 
                        size=12, color=ft.Colors.GREY),
                 ft.Text("進行状況はSteamCMDコンソールで確認できます", 
                        size=12, color=ft.Colors.GREY),
             ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
             actions=[]  # ボタンなし（キャンセル不可）
         )
-        
-        self.page.overlay.append(self._upload_progress_dialog)
+    
+    def _show_upload_progress_dialog(self):
+        """アップロード進行中ダイアログを表示"""
+        # コマンド送信を待たずに表示するため、バッチ中でもここで更新する
         self._upload_progress_dialog.open = True
         self.page.update()
     
-    def _close_upload_progress_dialog(self):
-        """アップロード進行中ダイアログを閉じる"""
-        if hasattr(self, '_upload_progress_dialog') and self._upload_progress_dialog:
-            DialogBuilder._close_dialog(self.page, self._upload_progress_dialog)
-            self._upload_progress_dialog = None
+    def _close_upload_progress_dialog(self, next_dialog: ft.AlertDialog = None):
+        """アップロード進行中ダイアログを閉じる（next_dialogがあれば同じ更新で開く）"""
+        dlg = self._upload_progress_dialog
+        if dlg is not None:
+            dlg.open = False
+        if next_dialog:
+            DialogBuilder.open_dialog(self.page, next_dialog, update=False)
+        self._mark_dirty()
+    
+    def _create_tailer(self):
+        """今回の実行分のログを追跡するLogTailerを作成（ログファイルが無ければNone）"""
+        log_path = ConsoleMonitor.find_log_path(self.helper.settings.get("steamcmd_path"))
+        return LogTailer(log_path) if log_path else None
+    
+    def _run_monitor(self, label: str, monitor):
+        """監視処理をワーカーで実行し、終わるまで10秒ごとに経過時間をログ出力（経過ログはワーカーを使わない）"""
+        monitor_done = threading.Event()
+        started = time.monotonic()
+        
+        def run():
+            try:
+                monitor()
+            finally:
+                monitor_done.set()
+        
+        def schedule_tick():
+            timer = threading.Timer(_PROGRESS_LOG_INTERVAL, tick)
+            timer.daemon = True
+            timer.start()
+        
+        def tick():
+            if monitor_done.is_set() or self._closing.is_set():
+                return
+            self._log.info(f"{label}処理中... ({int(time.monotonic() - started)}秒経過)")
+            schedule_tick()
+        
+        self._executor.submit(run)
+        schedule_tick()
     
-    def _monitor_upload_completion(self):
-        """アップロードの完了を監視"""
+    def close(self):
+        """監視ループを終了させ、ワーカーを停止（終了時に監視の待機で止まらないようにする）"""
+        self._closing.set()
+        self.helper.notify_monitors()
+        self._executor.shutdown(wait=False)
+    
+    def _monitor_upload_completion(self, tailer):
+        """アップロードの完了を監視（tailerは送信前に作成した今回の実行分のLogTailer）"""
         def monitor_thread():
             # 最初に少し待機してアップロード開始を確認
-            time.sleep(2)
+            self._closing.wait(2)
 
             # Steam>プロンプトが戻ってくるまで監視
-            max_wait = 600  # 最大10分待機
-            check_interval = 1.0  # 1秒間隔でチェック
-            elapsed = 0
+            # 経過時間は待機時間の積算ではなく単調時計の期限で判定する
+            deadline = time.monotonic() + 600  # 最大10分待機
+            timed_out = False
+            # ログが更新された時だけ確認する
+            gate = _LogActivityGate(self.helper.settings.get("steamcmd_path"))
+
+            while not self._closing.is_set():
+                if time.monotonic() >= deadline:
+                    timed_out = True
+                    break
+
+                log_changed = gate.poll()
+                if log_changed and tailer:
+                    tailer.poll()
 
-            while elapsed < max_wait:
                 # まず完了メッセージをチェック（より確実）
-                if self._check_upload_complete():
-                    self._log_message("アップロード完了メッセージを検出しました！")
+                if log_changed and self._check_upload_complete(tailer):
+                    self._log.info("アップロード完了メッセージを検出しました！")
                     # 少し待ってSteam>プロンプトが戻るのを待つ
-                    time.sleep(1)
+                    self._closing.wait(1)
 
-                    # ダイアログを閉じる
-                    self._close_upload_progress_dialog()
-                    # 成功メッセージを表示
-                    DialogBuilder.show_success_dialog(
+                    # ダイアログを閉じて成功メッセージを表示
+                    self._close_upload_progress_dialog(DialogBuilder.build_success_dialog(
                         self.page,
                         "アップロードが正常に完了しました！\nSteamパートナーサイトで確認してください。"
-                    )
+                    ))
                     break
 
-                time.sleep(check_interval)
-                elapsed += check_interval
-
-                # 10秒ごとに進捗をログ
-                if int(elapsed) % 10 == 0 and elapsed > 0:
-                    self._log_message(f"アップロード処理中... ({elapsed}秒経過)")
+                self.helper.wait_for_monitor_event(gate.interval)
 
-            if elapsed >= max_wait:
-                self._log_message("アップロード監視がタイムアウトしました")
-                self._close_upload_progress_dialog()
-                DialogBuilder.show_info_dialog(
+            if timed_out:
+                self._log.info("アップロード監視がタイムアウトしました")
+                self._close_upload_progress_dialog(DialogBuilder.build_info_dialog(
                     self.page,
                     "アップロード処理が長時間かかっています。\nSteamCMDコンソールで状況を確認してください。"
-                )
+                ))
 
         # 監視スレッドを開始
-        thread = threading.Thread(target=monitor_thread, daemon=True)
-        thread.start()
+        self._run_monitor("アップロード", monitor_thread)
     
     def _check_steam_prompt_returned(self) -> bool:
         """Steam>プロンプトが戻ってきたかチェック"""
         # platform_helpersの汎用実装を使用
         steamcmd_path = self.helper.settings.get("steamcmd_path")
-        return ConsoleMonitor.check_steam_prompt(steamcmd_path=steamcmd_path, log_callback=self._log_message)
+        return ConsoleMonitor.check_steam_prompt(steamcmd_path=steamcmd_path, log_callback=self._log.info)
 
-    def _check_upload_complete(self) -> bool:
+    def _check_upload_complete(self, tailer=None) -> bool:
         """アップロード完了をチェック"""
+        # ログファイルを追跡している場合は追記分だけを確認
+        if tailer:
+            return tailer.search(_UPLOAD_DONE_RE)
         # platform_helpersの汎用実装を使用
-        from platform_helpers import ConsoleMonitor
         # 完了メッセージのパターンをチェック
         steamcmd_path = self.helper.settings.get("steamcmd_path")
-        return ConsoleMonitor.check_for_pattern("Successfully finished AppID", steamcmd_path=steamcmd_path)
+        return ConsoleMonitor.check_for_pattern(_UPLOAD_DONE_PATTERN, steamcmd_path=steamcmd_path)
 
     
     def _execute_download_windows(self, download_command: str, app_id: str):
         """Windows環境でのダウンロード実行"""
-        self._log_message("自動コマンド送信を試行中...")
+        self._log.info("自動コマンド送信を試行中...")
+        
+        # 送信直後の出力も拾えるよう、送信前にログの読み取り位置を決めておく
+        tailer = self._create_tailer()
         
         # 共通のCommandSenderを使用
         success = CommandSender.send_command(
             download_command, 
-            "Steam>",
+            _STEAM_PROMPT,
             process_id=getattr(self.helper, 'steamcmd_cmd_process_id', None),
-            log_callback=self._log_message
+            log_callback=self._log.info
         )
         
         if success:
-            self._log_message("✓ ダウンロードコマンドを自動実行しました")
-            self._log_message("ダウンロードが完了するまでお待ちください...")
+            self._log.info("✓ ダウンロードコマンドを自動実行しました")
+            self._log.info("ダウンロードが完了するまでお待ちください...")
             # ダウンロード完了を監視
-            self._monitor_download_completion(app_id)
+            self._monitor_download_completion(app_id, tailer)
         else:
-            self._log_message("自動送信に失敗しました。")
-            # 進行中ダイアログを閉じる
-            self._close_download_progress_dialog()
-            # 失敗時は手動でダイアログを表示（フォールバック）
+            self._log.info("自動送信に失敗しました。")
+            # 失敗時は進行中ダイアログを手動実行ダイアログに切り替える（フォールバック）
             self._show_manual_download_dialog(download_command)
     
-    def _execute_download_unix(self, download_command: str, app_id: str):
-        """Unix系環境でのダウンロード実行"""
-        if platform.system() == "Darwin":
-            self._execute_download_macos(download_command, app_id)
-        else:
-            # Linuxでは手動実行を促す
-            self._close_download_progress_dialog()
-            self._show_manual_download_dialog(download_command)
+    def _execute_download_manual(self, download_command: str, app_id: str):
+        """自動送信に未対応の環境（Linux）でのダウンロード実行"""
+        # 進行中ダイアログを閉じて手動実行を促す
+        self._show_manual_download_dialog(download_command)
     
     def _execute_download_macos(self, download_command: str, app_id: str):
         """macOS環境でのダウンロード実行"""
-        self._log_message("自動コマンド送信を試行中...")
+        self._log.info("自動コマンド送信を試行中...")
+        
+        # 送信直後の出力も拾えるよう、送信前にログの読み取り位置を決めておく
+        tailer = self._create_tailer()
         
         # 共通のCommandSenderを使用
         success = CommandSender.send_command(
             download_command,
-            "Steam>",
-            log_callback=self._log_message
+            _STEAM_PROMPT,
+            log_callback=self._log.info
         )
         
         if success:
-            self._log_message("✓ ダウンロードコマンドを自動実行しました")
-            self._log_message("ダウンロードが完了するまでお待ちください...")
+            self._log.info("✓ ダウンロードコマンドを自動実行しました")
+            self._log.info("ダウンロードが完了するまでお待ちください...")
             # ダウンロード完了を監視
-            self._monitor_download_completion(app_id)
+            self._monitor_download_completion(app_id, tailer)
         else:
-            self._log_message("自動送信に失敗しました。")
-            # 進行中ダイアログを閉じる
-            self._close_download_progress_dialog()
-            # 失敗時は手動でダイアログを表示（フォールバック）
+            self._log.info("自動送信に失敗しました。")
+            # 失敗時は進行中ダイアログを手動実行ダイアログに切り替える（フォールバック）
             self._show_manual_download_dialog(download_command)
     
     def _show_download_progress_dialog(self):
         """ダウンロード進行中ダイアログを表示"""
-        self._download_progress_dialog = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("ダウンロード中"),
-            content=ft.Column([
-                ft.ProgressRing(width=40, height=40, stroke_width=3),
-                ft.Text("Steamからダウンロード中です...", size=14),
-                ft.Container(height=10),
-                ft.Text("ダウンロードが完了するまでお待ちください", 
-                       size=12, color=ft.Colors.GREY),
-                ft.Text("進行状況はSteamCMDコンソールで確認できます", 
-                       size=12, color=ft.Colors.GREY),
-            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
-            actions=[]  # ボタンなし（キャンセル不可）
-        )
-        
-        self.page.overlay.append(self._download_progress_dialog)
+        # コマンド送信を待たずに表示するため、バッチ中でもここで更新する
         self._download_progress_dialog.open = True
         self.page.update()
     
-    def _close_download_progress_dialog(self):
-        """ダウンロード進行中ダイアログを閉じる"""
-        if hasattr(self, '_download_progress_dialog') and self._download_progress_dialog:
-            DialogBuilder._close_dialog(self.page, self._download_progress_dialog)
-            self._download_progress_dialog = None
+    def _close_download_progress_dialog(self, next_dialog: ft.AlertDialog = None):
+        """ダウンロード進行中ダイアログを閉じる（next_dialogがあれば同じ更新で開く）"""
+        dlg = self._download_progress_dialog
+        if dlg is not None:
+            dlg.open = False
+        if next_dialog:
+            DialogBuilder.open_dialog(self.page, next_dialog, update=False)
+        self._mark_dirty()
     
     def _show_manual_download_dialog(self, download_command: str):
-        """手動でダウンロードコマンドを実行するためのダイアログを表示"""
+        """手動でダウンロードコマンドを実行するためのダイアログを表示（進行中ダイアログと同じ更新で切り替え）"""
+        self._download_command_text.value = download_command
+        self._close_download_progress_dialog(self._download_command_dialog)
         # クリップボードにコピー
         self.page.set_clipboard(download_command)
         
-        dlg = ft.AlertDialog(
-            modal=True,
-            title=ft.Text("ダウンロードコマンド"),
-            content=ft.Column([
-                ft.Text("以下のコマンドをSteamCMDコンソールで実行してください："),
-                ft.Container(
-                    content=ft.Text(download_command, selectable=True),
-                    bgcolor=ft.Colors.GREY_900,
-                    padding=10,
-                    border_radius=5
-                ),
-                ft.Text("(コマンドはクリップボードにコピーされました)", 
-                       size=12, color=ft.Colors.GREY)
-            ], width=400),
-            actions=[
-                ft.TextButton("OK", on_click=lambda e: DialogBuilder._close_dialog(self.page, dlg))
-            ]
-        )
-        
-        self.page.overlay.append(dlg)
-        dlg.open = True
-        self.page.update()
-        
-        self._log_message(f"Please run in SteamCMD console: {download_command}")
+        self._log.info(f"Please run in SteamCMD console: {download_command}")
     
-    def _monitor_download_completion(self, app_id: str):
-        """ダウンロードの完了を監視"""
+    def _monitor_download_completion(self, app_id: str, tailer):
+        """ダウンロードの完了を監視（tailerは送信前に作成した今回の実行分のLogTailer）"""
         def monitor_thread():
             # 最初に少し待機してダウンロード開始を確認
-            time.sleep(2)
+            self._closing.wait(2)
 
             # Steam>プロンプトが戻ってくるまで監視
-            max_wait = 600  # 最大10分待機
-            check_interval = 1.0  # 1秒間隔でチェック
-            elapsed = 0
+            # 経過時間は待機時間の積算ではなく単調時計の期限で判定する
+            deadline = time.monotonic() + 600  # 最大10分待機
+            timed_out = False
+            # ログが更新された時だけ確認する
+            gate = _LogActivityGate(self.helper.settings.get("steamcmd_path"))
 
             # エラーメッセージをチェックするためのフラグ
             error_detected = False
 
-            while elapsed < max_wait:
+            while not self._closing.is_set():
+                if time.monotonic() >= deadline:
+                    timed_out = True
+                    break
+
+                log_changed = gate.poll()
+                if log_changed and tailer:
+                    tailer.poll()
+
                 # まず完了メッセージをチェック（より確実）
-                if self._check_download_complete():
-                    self._log_message("ダウンロード完了メッセージを検出しました！")
+                if log_changed and self._check_download_complete(tailer):
+                    self._log.info("ダウンロード完了メッセージを検出しました！")
                     # 少し待ってSteam>プロンプトが戻るのを待つ
-                    time.sleep(1)
+                    self._closing.wait(1)
 
                     # ダウンロード先を確認
                     download_path = self._get_download_path(app_id)
-                    # ダイアログを閉じる
-                    self._close_download_progress_dialog()
-                    # 成功メッセージを表示
-                    DialogBuilder.show_success_dialog(
+                    # ダイアログを閉じて成功メッセージを表示
+                    self._close_download_progress_dialog(DialogBuilder.build_success_dialog(
                         self.page,
                         f"ダウンロードが正常に完了しました！\nダウンロード先: {download_path}"
-                    )
+                    ))
                     break
 
                 # エラーチェック
-                if self._check_download_error():
-                    self._log_message("ダウンロードエラーを検出しました")
-                    self._close_download_progress_dialog()
-                    DialogBuilder.show_error_dialog(
+                if log_changed and self._check_download_error(tailer):
+                    self._log.info("ダウンロードエラーを検出しました")
+                    self._close_download_progress_dialog(DialogBuilder.build_error_dialog(
                         self.page,
                         "ダウンロードに失敗しました。\n\n考えられる原因：\n" +
                         "• App IDまたはDepot IDが正しくない\n" +
@@ -590,81 +773,81 @@ class UploadManager:
                         "ゲームを所有しており、正しいIDを使用している場合は、\n" +
                         "別のデポIDを試すか、DepotDownloaderなどの\n" +
                         "サードパーティツールの使用を検討してください。"
-                    )
+                    ))
                     error_detected = True
                     break
 
-                time.sleep(check_interval)
-                elapsed += check_interval
-
-                # 10秒ごとに進捗をログ
-                if int(elapsed) % 10 == 0 and elapsed > 0:
-                    self._log_message(f"ダウンロード処理中... ({elapsed}秒経過)")
+                self.helper.wait_for_monitor_event(gate.interval)
 
-            if elapsed >= max_wait:
-                self._log_message("ダウンロード監視がタイムアウトしました")
-                self._close_download_progress_dialog()
-                DialogBuilder.show_info_dialog(
+            if timed_out:
+                self._log.info("ダウンロード監視がタイムアウトしました")
+                self._close_download_progress_dialog(DialogBuilder.build_info_dialog(
                     self.page,
                     "ダウンロード処理が長時間かかっています。\nSteamCMDコンソールで状況を確認してください。"
-                )
+                ))
 
         # 監視スレッドを開始
-        thread = threading.Thread(target=monitor_thread, daemon=True)
-        thread.start()
+        self._run_monitor("ダウンロード", monitor_thread)
     
     def _get_download_path(self, app_id: str) -> str:
         """ダウンロードパスを取得"""
-        # SteamCMDのデフォルトダウンロードパスを構築
-        # settingsからsteamcmd_pathを取得
-        steamcmd_path = self.helper.settings.get("steamcmd_path")
-        if not steamcmd_path:
-            # steamcmd_pathが保存されていない場合はcontent_builder_pathから取得
-            content_builder_path = self.helper.settings.get("content_builder_path")
-            if content_builder_path:
-                from platform_helpers import SteamCMDLauncher
-                steamcmd_path = SteamCMDLauncher.get_steamcmd_path(content_builder_path)
-        
-        if steamcmd_path:
-            steamcmd_dir = os.path.dirname(steamcmd_path)
-            download_path = os.path.join(steamcmd_dir, "steamapps", "content", f"app_{app_id}")
-            return download_path
-        else:
-            # フォールバックとして現在のディレクトリを使用
-            return os.path.join(os.getcwd(), "steamapps", "content", f"app_{app_id}")
+        settings = self.helper.settings
+        return _compute_download_path(settings.get("steamcmd_path"), settings.get("content_builder_path"), app_id)
     
-    
-    def _check_download_error(self) -> bool:
+    def _check_download_error(self, tailer=None) -> bool:
         """ダウンロードエラーをチェック"""
+        # ログファイルを追跡している場合は追記分を1回だけ走査
+        if tailer:
+            return tailer.search(_DOWNLOAD_ERROR_RE)
         # platform_helpersの汎用実装を使用
-        from platform_helpers import ConsoleMonitor
         # エラーメッセージのパターンをチェック
-        return ConsoleMonitor.check_for_error_pattern([
-            "Depot download failed",
-            "Invalid default manifest",
-            "missing app info",
-            "Missing configuration"
-        ])
+        return ConsoleMonitor.check_for_error_pattern(_DOWNLOAD_ERROR_PATTERNS)
 
-    def _check_download_complete(self) -> bool:
+    def _check_download_complete(self, tailer=None) -> bool:
         """ダウンロード完了をチェック"""
+        # ログファイルを追跡している場合は追記分だけを確認
+        if tailer:
+            return tailer.search(_DOWNLOAD_DONE_RE)
         # platform_helpersの汎用実装を使用
-        from platform_helpers import ConsoleMonitor
         # 完了メッセージのパターンをチェック
         steamcmd_path = self.helper.settings.get("steamcmd_path")
-        return ConsoleMonitor.check_for_pattern("Depot download complete", steamcmd_path=steamcmd_path)
+        return ConsoleMonitor.check_for_pattern(_DOWNLOAD_DONE_PATTERN, steamcmd_path=steamcmd_path)
 
-    def _on_download_field_change(self):
-        """ダウンロードフィールドの入力変更時の処理"""
-        # App IDが入力されたらビルドページボタンを有効化
-        app_id = self.download_app_id_field.value
-        self.open_builds_page_button.disabled = not app_id.strip()
-        
-        # ログイン状態を取得（helper.is_logged_in を使用）
-        is_logged_in = self.helper.is_logged_in if self.helper else False
-        self._update_download_button_states(is_logged_in)
-        
-        self.page.update()
+    def _cached_exists(self, path: str) -> bool:
+        """パスの存在確認（短時間の繰り返し確認は前回の結果を使う）"""
+        now = time.monotonic()
+        cached = self._path_exists_cache.get(path)
+        if cached and now - cached[0] < _EXISTS_CACHE_TTL:
+            return cached[1]
+        exists = os.path.exists(path)
+        self._path_exists_cache[path] = (now, exists)
+        return exists
+    
+    def _on_download_field_change(self, e=None):
+        """ダウンロードフィールドの入力変更時の処理（連続入力は最後の1回だけ反映）"""
+        with self._field_change_lock:
+            if self._field_change_timer is not None:
+                self._field_change_timer.cancel()
+            self._field_change_timer = threading.Timer(_FIELD_CHANGE_DEBOUNCE, self._apply_download_field_change)
+            self._field_change_timer.daemon = True
+            self._field_change_timer.start()
+    
+    def _apply_download_field_change(self):
+        """ダウンロードフィールドの入力内容をボタン状態に反映"""
+        # 入力が変わったらフォルダの存在確認をやり直す
+        self._path_exists_cache.clear()
+        
+        with self._ui_batch():
+            # App IDが入力されたらビルドページボタンを有効化
+            app_id = self.download_app_id_field.value
+            builds_disabled = not app_id.strip()
+            if self.open_builds_page_button.disabled != builds_disabled:
+                self.open_builds_page_button.disabled = builds_disabled
+                self._mark_dirty()
+            
+            # ログイン状態を取得（helper.is_logged_in を使用）
+            is_logged_in = self.helper.is_logged_in if self.helper else False
+            self._update_download_button_states(is_logged_in)
     
     def _update_download_button_states(self, is_logged_in: bool):
         """ダウンロード関連ボタンの状態を更新"""
@@ -674,23 +857,32 @@ class UploadManager:
         manifest_gid = self.download_manifest_gid_field.value.strip() if self.download_manifest_gid_field.value else ""
         
         # ダウンロード開始ボタン: ログイン済み + 3つ全て入力
-        self.download_start_button.disabled = not (is_logged_in and app_id and depot_id and manifest_gid)
-        
+        start_disabled = not (is_logged_in and app_id and depot_id and manifest_gid)
         # フォルダを開くボタン: AppIDとDepotIDが入力されていれば
-        self.open_download_folder_button.disabled = not (app_id and depot_id)
+        folder_disabled = not (app_id and depot_id)
+        
+        if (self.download_start_button.disabled != start_disabled
+                or self.open_download_folder_button.disabled != folder_disabled):
+            self.download_start_button.disabled = start_disabled
+            self.open_download_folder_button.disabled = folder_disabled
+            self._mark_dirty()
     
-    def _open_builds_page(self):
+    def _open_builds_page(self, e=None):
         """ビルドページを開く"""
         app_id = self.download_app_id_field.value
         if app_id:
             url = f"https://partner.steamgames.com/apps/builds/{app_id}"
-            webbrowser.open(url)
-            self._log_message(f"ビルドページを開きました: {url}")
+            try:
+                _webbrowser().open(url)
+            except Exception as ex:
+                self._log.info(f"ビルドページを開けませんでした: {ex}")
+                return
+            self._log.info(f"ビルドページを開きました: {url}")
     
-    def run_download_with_manifest(self):
+    def run_download_with_manifest(self, e=None):
         """ManifestGID指定でダウンロード処理を実行"""
         if self.download_in_progress:
-            self._log_message("ダウンロード処理中...")
+            self._log.info("ダウンロード処理中...")
             return
         
         if not self.helper.is_logged_in:
@@ -710,41 +902,46 @@ class UploadManager:
             )
             return
         
-        self.download_in_progress = True
-        self.download_start_button.disabled = True
-        self.progress_bar.visible = True
-        self.page.update()
-        
-        try:
-            self._log_message(f"ダウンロード開始:")
-            self._log_message(f"App ID: {app_id}")
-            self._log_message(f"Depot ID: {depot_id}")
-            self._log_message(f"Manifest GID: {manifest_gid}")
-            
-            # download_depotコマンドを構築（ManifestGID付き）
-            download_command = f"download_depot {app_id} {depot_id} {manifest_gid}"
-            
-            self._log_message(f"実行コマンド: {download_command}")
+        # 開始から終了までのUI変更を1回の更新にまとめる（進行中ダイアログの表示時だけ途中で更新）
+        with self._ui_batch():
+            self.download_in_progress = True
+            self.download_start_button.disabled = True
+            self.progress_bar.visible = True
+            self._mark_dirty()
             
-            # ダウンロード進行中ダイアログを表示
-            self._show_download_progress_dialog()
-            
-            # プラットフォーム別の実行
-            if platform.system() == "Windows":
-                self._execute_download_windows(download_command, app_id)
-            else:
-                self._execute_download_unix(download_command, app_id)
+            try:
+                # download_depotコマンドを構築（ManifestGID付き）
+                download_command = f"download_depot {app_id} {depot_id} {manifest_gid}"
+                
+                self._log.info(
+                    f"ダウンロード開始:\n"
+                    f"App ID: {app_id}\n"
+                    f"Depot ID: {depot_id}\n"
+                    f"Manifest GID: {manifest_gid}\n"
+                    f"実行コマンド: {download_command}"
+                )
+                
+                # ダウンロード進行中ダイアログを表示
+                self._show_download_progress_dialog()
+                
+                # プラットフォーム別の実行
+                getattr(self, _DOWNLOAD_EXECUTOR)(download_command, app_id)
             
-        except Exception as ex:
-            self._log_message(f"ダウンロード中にエラー: {str(ex)}")
-            DialogBuilder.show_error_dialog(self.page, f"ダウンロードエラー: {str(ex)}")
-        finally:
-            self.download_start_button.disabled = False
-            self.download_in_progress = False
-            self.progress_bar.visible = False
-            self.page.update()
+            except Exception as ex:
+                self._log.info(f"ダウンロード中にエラー: {str(ex)}")
+                # ページ更新はバッチの終了時にまとめて行う
+                DialogBuilder.open_dialog(
+                    self.page,
+                    DialogBuilder.build_error_dialog(self.page, f"ダウンロードエラー: {str(ex)}"),
+                    update=False
+                )
+            finally:
+                self.download_start_button.disabled = False
+                self.download_in_progress = False
+                self.progress_bar.visible = False
+                self._mark_dirty()
     
-    def open_download_folder_from_input(self):
+    def open_download_folder_from_input(self, e=None):
         """入力されたApp IDからダウンロードフォルダを開く"""
         app_id = self.download_app_id_field.value.strip()
         depot_id = self.download_depot_id_field.value.strip()
@@ -755,20 +952,18 @@ class UploadManager:
         
         # パスを構築（depot_idも含む場合）
         download_path = self._get_download_path(app_id)
-        if depot_id and os.path.exists(download_path):
+        download_exists = self._cached_exists(download_path)
+        if depot_id and download_exists:
             # depot_idフォルダがあるかチェック
             depot_path = os.path.join(download_path, f"depot_{depot_id}")
-            if os.path.exists(depot_path):
+            if self._cached_exists(depot_path):
                 download_path = depot_path
         
-        if os.path.exists(download_path):
-            if platform.system() == "Windows":
-                os.startfile(download_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.call(["open", download_path])
-            else:  # Linux
-                subprocess.call(["xdg-open", download_path])
-            self._log_message(f"ダウンロードフォルダを開きました: {download_path}")
+        if download_exists:
+            if PlatformUtilities.open_folder(download_path):
+                self._log.info(f"ダウンロードフォルダを開きました: {download_path}")
+            else:
+                self._log.info(f"ダウンロードフォルダを開けませんでした: {download_path}")
         else:
             DialogBuilder.show_error_dialog(
                 self.page,
@@ -776,8 +971,3 @@ class UploadManager:
                 "まだダウンロードが完了していないか、\n" +
                 "異なるApp ID/Depot IDの可能性があります。"
             )
-    
-    def _log_message(self, message: str):
-        """ログメッセージ出力"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
\ No newline at end of file
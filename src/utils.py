@@ -2,45 +2,172 @@
 Utility functions for Morn Steam Upload Helper.
 """
 
+import atexit
+import collections
+import logging
+import logging.handlers
 import os
-import webbrowser
-from datetime import datetime
-from pathlib import Path
+import queue
+import stat
+import sys
+import threading
+import time
+from pathlib import Path, PurePath
 # OS依存の処理はplatform_helpersからインポート
-from platform_helpers import PlatformUtilities, SteamCMDLauncher
+from platform_helpers import PlatformUtilities, SteamCMDLauncher, _IS_WINDOWS, _webbrowser
+
+
+_log_listener = None
+_created_dirs = set()  # directories already created by create_directories()
+_last_ts_second = None  # second last formatted by get_timestamp()
+_last_ts_str = ""
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records within the same second and stamps every line."""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_sec = None
+        self._cached_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._cached_sec:
+            self._cached_str = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            self._cached_sec = sec
+        return self._cached_str
+
+    def formatMessage(self, record):
+        message = record.message
+        if "\n" not in message:
+            return super().formatMessage(record)
+        # Multi-line records stay one write but get the timestamp prefix on every line
+        lines = []
+        for line in message.split("\n"):
+            record.message = line
+            lines.append(super().formatMessage(record))
+        record.message = message
+        return "\n".join(lines)
+
+
+class _ThrottledStreamHandler(logging.StreamHandler):
+    """StreamHandler that collects records and writes them in one block every flush interval."""
+
+    FLUSH_INTERVAL = 0.05  # seconds (at most 20 writes per second)
+    MAX_PENDING = 4096  # oldest lines are dropped if the stream stops accepting writes
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._pending = collections.deque(maxlen=self.MAX_PENDING)
+        self._last_record = None
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._run, name="log-flusher", daemon=True)
+        self._flusher.start()
+
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+            self._last_record = record
+        except Exception:
+            self.handleError(record)
+
+    def _run(self):
+        while not self._stop.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self._pending:
+                return
+            chunks = []
+            while self._pending:
+                chunks.append(self._pending.popleft())
+            try:
+                # stream is None under pythonw; the write then fails and goes to handleError
+                self.stream.write("".join(chunks))
+                super().flush()
+            except Exception:
+                self.handleError(self._last_record)
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+        super().close()
+
+
+def setup_logging():
+    """Route the app's loggers through a queue to a background stdout writer."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.Queue()
+    # pythonw などで stdout が無い場合は stderr (StreamHandler の既定) に任せる
+    handler = _ThrottledStreamHandler(sys.stdout)
+    handler.setFormatter(_CachedTimeFormatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+
+    logger = logging.getLogger("msuh")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Drain queued records and stop the background writer (safe to call twice)."""
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 
 def open_content_folder(content_path):
     """Open the content folder in the system file explorer."""
-    if content_path and os.path.exists(content_path):
-        folder_path = os.path.dirname(content_path) if os.path.isfile(content_path) else content_path
-        return PlatformUtilities.open_folder(folder_path)
-    return False
+    if not content_path:
+        return False
+    try:
+        st = os.stat(content_path)
+    except (OSError, ValueError):
+        return False
+    folder_path = os.path.dirname(content_path) if stat.S_ISREG(st.st_mode) else content_path
+    return PlatformUtilities.open_folder(folder_path)
 
 
 def log_message(message):
     """Log a message with timestamp."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = get_timestamp()
     log_entry = f"[{timestamp}] {message}"
-    print(log_entry)
+    if _log_listener is not None:
+        # ロガーと同じキューを通して出力順を揃える
+        logging.getLogger("msuh").info(message)
+    else:
+        print(log_entry)
     return log_entry
 
 
+_URL_TEMPLATES = {
+    "store": "https://store.steampowered.com/app/{}/",
+    "partner": "https://partner.steamgames.com/apps/landing/{}",
+    "builds": "https://partner.steamgames.com/apps/builds/{}",
+    "depots": "https://partner.steamgames.com/apps/depots/{}",
+}
+
+
 def open_steam_page(page_type, app_id):
     """Open Steam partner pages in web browser."""
     if not app_id:
         return
     
-    base_url = "https://partner.steamgames.com"
-    urls = {
-        "store": f"https://store.steampowered.com/app/{app_id}/",
-        "partner": f"{base_url}/apps/landing/{app_id}",
-        "builds": f"{base_url}/apps/builds/{app_id}",
-        "depots": f"{base_url}/apps/depots/{app_id}"
-    }
-    
-    if page_type in urls:
-        webbrowser.open(urls[page_type])
+    template = _URL_TEMPLATES.get(page_type)
+    if template:
+        _webbrowser().open(template.format(app_id))
 
 
 def open_steam_page_for_config(page_type, app_id):
@@ -50,6 +177,9 @@ def open_steam_page_for_config(page_type, app_id):
 
 def cleanup_temp_scripts():
     """Remove any temporary script files containing credentials."""
+    # No configs folder means no scripts were ever written
+    if not os.path.isdir("./configs"):
+        return
     try:
         # Clean up all possible temporary script paths
         temp_scripts = [
@@ -69,9 +199,7 @@ def cleanup_temp_scripts():
 
 def ensure_executable(file_path):
     """Make a file executable on Unix systems."""
-    # platform_helpersではWindowsチェックが必要
-    import platform
-    if platform.system() != "Windows" and file_path and os.path.exists(file_path):
+    if not _IS_WINDOWS and file_path and os.path.exists(file_path):
         try:
             os.chmod(file_path, 0o755)
             return True
@@ -90,7 +218,11 @@ def get_steamcmd_path(content_builder_path):
 def create_directories(*paths):
     """Create directories if they don't exist."""
     for path in paths:
+        key = str(path)
+        if key in _created_dirs:
+            continue
         Path(path).mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(key)
 
 
 def get_platform_terminal_command(script_path):
@@ -112,7 +244,9 @@ def format_path_for_steam(path):
     """Format path for Steam VDF files."""
     # Convert to absolute path and use forward slashes
     abs_path = os.path.abspath(path)
-    return abs_path.replace('\\', '/')
+    if os.sep == '/':
+        return abs_path
+    return PurePath(abs_path).as_posix()
 
 
 def is_process_running(process_name):
@@ -121,5 +255,10 @@ def is_process_running(process_name):
 
 
 def get_timestamp():
-    """Get formatted timestamp string."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
\ No newline at end of file
+    """Get formatted timestamp string (formatted at most once per second)."""
+    global _last_ts_second, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_second:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_ts_second = sec
+    return _last_ts_str
\ No newline at end of file